@@ -0,0 +1,45 @@
+"""
+Benchmark: fused box_ops.convert vs one pass per conversion step
+
+Run from the repository root:
+    python -m benchmarks.bench_box_ops [n_boxes]
+"""
+
+import sys
+
+import numpy as np
+
+from benchmarks.bench_fruits import best_of
+from src.box_ops import convert
+
+CHAIN = ("xyxy", "yxyx", "xywh", "cxcywh")
+
+
+def step_by_step(boxes):
+    for src, dst in zip(CHAIN, CHAIN[1:]):
+        boxes = convert(boxes, src, dst)
+    return boxes
+
+
+def bench(label: str, boxes) -> None:
+    separate = best_of(lambda: step_by_step(boxes))
+    fused = best_of(lambda: convert(boxes, *CHAIN))
+    print(f"  {label:<16} separate passes: {separate * 1e3:8.1f} ms"
+          f"   fused: {fused * 1e3:8.1f} ms   ({separate / fused:.1f}x)")
+
+
+if __name__ == "__main__":
+    n_boxes = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    print("=" * 60)
+    print(f"BENCHMARK: {' -> '.join(CHAIN)} on {n_boxes:,} boxes")
+    print("=" * 60)
+    rng = np.random.default_rng(0)
+    boxes = rng.uniform(0, 1000, size=(n_boxes, 5)).astype(np.float32)
+    bench("numpy float32", boxes)
+    bench("numpy int64", boxes.astype(np.int64))
+    try:
+        import torch
+    except ImportError:
+        print("  torch not installed - skipping tensor benchmark")
+    else:
+        bench("torch float32", torch.from_numpy(boxes))
@@ -0,0 +1,42 @@
+"""
+Benchmark: BoxSet (float32 / int16 struct-of-arrays) vs int64 (N, 5) arrays
+
+Run from the repository root:
+    python -m benchmarks.bench_boxset [n_boxes]
+"""
+
+import sys
+
+import numpy as np
+
+from benchmarks.bench_fruits import best_of
+from src.boxset import BoxSet
+from src.coords import swap
+
+
+def array_areas(coords: np.ndarray) -> np.ndarray:
+    return (coords[:, 2] - coords[:, 0]) * (coords[:, 3] - coords[:, 1])
+
+
+if __name__ == "__main__":
+    n_boxes = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = np.random.default_rng(0)
+    coords = rng.integers(0, 4096, size=(n_boxes, 5))
+    coords[:, 4] %= 80
+
+    print("=" * 60)
+    print(f"BENCHMARK: {n_boxes:,} boxes")
+    print("=" * 60)
+    print(f"  {'layout':<22} {'MB':>8} {'areas (ms)':>12} {'swap (ms)':>12} {'class==3 (ms)':>14}")
+    rows = [("int64 (N, 5) array", coords.nbytes,
+             best_of(lambda: array_areas(coords)),
+             best_of(lambda: swap(coords)),
+             best_of(lambda: coords[coords[:, 4] == 3]))]
+    for dtype in (np.float32, np.int16):
+        boxes = BoxSet.from_array(coords, dtype)
+        rows.append((f"BoxSet {np.dtype(dtype).name}", boxes.nbytes,
+                     best_of(boxes.areas),
+                     best_of(boxes.swap),
+                     best_of(lambda: boxes[boxes.class_ids == 3])))
+    for name, nbytes, areas, swapped, select in rows:
+        print(f"  {name:<22} {nbytes / 2**20:>8.0f} {areas * 1e3:>12.2f} {swapped * 1e3:>12.3f} {select * 1e3:>14.2f}")
@@ -0,0 +1,72 @@
+"""
+Benchmark: time and peak RSS of src.coords.swap modes
+
+Each mode runs in a fresh subprocess so ru_maxrss reflects only that mode.
+
+Run from the repository root:
+    python -m benchmarks.bench_coords_swap [n_rows]
+"""
+
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from src.coords import swap
+
+MODES = ["original", "copy", "out", "inplace"]
+DTYPES = ["int64", "float32", "int32"]
+
+
+def swap_original(coords: np.ndarray) -> np.ndarray:
+    """The pre-optimization implementation, kept for comparison."""
+    swapped = coords.copy()
+    swapped[:, 0], swapped[:, 1] = coords[:, 1], coords[:, 0]
+    swapped[:, 2], swapped[:, 3] = coords[:, 3], coords[:, 2]
+    return swapped
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode: str, dtype: str, n_rows: int) -> None:
+    coords = np.ones((n_rows, 5), dtype=dtype)
+    out = np.ones_like(coords) if mode == "out" else None
+    base_rss = peak_rss_mb()
+    start = time.perf_counter()
+    if mode == "original":
+        swap_original(coords)
+    elif mode == "copy":
+        swap(coords)
+    elif mode == "out":
+        swap(coords, out=out)
+    else:
+        swap(coords, inplace=True)
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed:.4f} {peak_rss_mb() - base_rss:.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] in MODES:
+        run_mode(sys.argv[1], sys.argv[2], int(sys.argv[3]))
+        sys.exit(0)
+
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000_000
+    print("=" * 60)
+    print(f"BENCHMARK: swap on ({n_rows:,}, 5) arrays")
+    print("=" * 60)
+    for dtype in DTYPES:
+        array_mb = n_rows * 5 * np.dtype(dtype).itemsize / 2**20
+        print(f"\n{dtype} (input array: {array_mb:.0f} MB)")
+        print(f"  {'mode':<10} {'time (s)':>10} {'extra peak RSS (MB)':>22}")
+        for mode in MODES:
+            result = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_coords_swap", mode, dtype, str(n_rows)],
+                capture_output=True, text=True, check=True,
+            )
+            elapsed, rss = result.stdout.split()
+            print(f"  {mode:<10} {float(elapsed):>10.3f} {float(rss):>22.1f}")
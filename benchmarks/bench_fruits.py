@@ -0,0 +1,71 @@
+"""
+Micro-benchmark: FruitCatalog vs. per-call sorting in id_to_fruit_fixed
+
+Run from the repository root:
+    python -m benchmarks.bench_fruits
+"""
+
+import random
+import string
+import time
+
+from exercise1_fruits import id_to_fruit_fixed
+from src.fruits import FruitCatalog
+
+
+def make_labels(n: int, seed: int = 0) -> set:
+    rng = random.Random(seed)
+    labels = set()
+    while len(labels) < n:
+        labels.add("".join(rng.choices(string.ascii_lowercase, k=12)))
+    return labels
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    """Fastest of ``repeat`` calls of ``fn``, in seconds (also used by other benchmarks)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench(n: int, lookups: int, sorted_lookups: int) -> None:
+    labels = make_labels(n)
+    ids = [random.randrange(n) for _ in range(lookups)]
+
+    def per_call_sort():
+        for fruit_id in ids[:sorted_lookups]:
+            id_to_fruit_fixed(fruit_id, labels)
+
+    build = best_of(lambda: FruitCatalog(labels), repeat=1)
+    catalog = FruitCatalog(labels)
+    names = [catalog.id_to_name(i) for i in ids]
+
+    def catalog_ids():
+        for fruit_id in ids:
+            catalog.id_to_name(fruit_id)
+
+    def catalog_names():
+        for name in names:
+            catalog.name_to_id(name)
+
+    sort_per_lookup = best_of(per_call_sort, repeat=1) / sorted_lookups
+    id_per_lookup = best_of(catalog_ids) / lookups
+    name_per_lookup = best_of(catalog_names) / lookups
+
+    print(f"\nn = {n:,} labels")
+    print(f"  id_to_fruit_fixed (sort per call): {sort_per_lookup * 1e6:12.2f} us/lookup")
+    print(f"  FruitCatalog build (once):         {build * 1e3:12.2f} ms")
+    print(f"  FruitCatalog.id_to_name:           {id_per_lookup * 1e6:12.4f} us/lookup")
+    print(f"  FruitCatalog.name_to_id:           {name_per_lookup * 1e6:12.4f} us/lookup")
+    print(f"  speedup (id_to_name):              {sort_per_lookup / id_per_lookup:12.0f}x")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("BENCHMARK: FruitCatalog vs per-call sort")
+    print("=" * 60)
+    bench(10_000, lookups=100_000, sorted_lookups=200)
+    bench(1_000_000, lookups=100_000, sorted_lookups=3)
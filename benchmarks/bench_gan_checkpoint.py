@@ -0,0 +1,57 @@
+"""
+Benchmark: GAN step time with no checkpoints, synchronous torch.save and
+AsyncCheckpointer
+
+Run from the repository root:
+    python -m benchmarks.bench_gan_checkpoint [n_steps] [every]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import torch
+
+from exercise4_gan import Discriminator, Generator
+from src.checkpoint import AsyncCheckpointer, save_checkpoint
+from src.gan_step import GANStep
+from src.mnist import TensorMNIST
+
+
+def run(batches, every: int, mode: str, path: str) -> float:
+    """Mean seconds per step; mode is "none", "sync" or "async"."""
+    torch.manual_seed(0)
+    step = GANStep(Generator(), Discriminator())
+    writer = AsyncCheckpointer(path) if mode == "async" else None
+    start = time.perf_counter()
+    for i, real in enumerate(batches, 1):
+        step(real)
+        if i % every == 0:
+            state = {"step": step.state_dict(), "torch_rng": torch.get_rng_state()}
+            if mode == "sync":
+                save_checkpoint(state, path)
+            elif mode == "async":
+                writer.save(state)
+    elapsed = time.perf_counter() - start
+    if writer is not None:
+        writer.close()
+        print(f"    async: {writer.saves} saves, snapshot {writer.snapshot_seconds / writer.saves * 1e3:.1f} ms"
+              f" on the loop, write {writer.write_seconds / writer.saves * 1e3:.1f} ms in the background")
+    return elapsed / len(batches)
+
+
+if __name__ == "__main__":
+    n_steps = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    every = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    dataset = TensorMNIST.synthetic(n_steps * 64).normalized()
+    batches = [images for images, _ in dataset.batches(64, shuffle=False)]
+    print("=" * 60)
+    print(f"BENCHMARK: {n_steps} GAN steps, checkpoint every {every} steps ({os.cpu_count()} CPUs)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "gan.pt")
+        results = {mode: run(batches, every, mode, path) for mode in ("none", "sync", "async")}
+    base = results["none"]
+    for mode, seconds in results.items():
+        print(f"  {mode:<6} {seconds * 1e3:8.2f} ms / step   (+{(seconds / base - 1) * 100:5.1f}% vs none)")
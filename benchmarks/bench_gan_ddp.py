@@ -0,0 +1,34 @@
+"""
+Benchmark: data-parallel GAN training throughput at 1/2/4/8 processes
+
+Every process trains on its DistributedSampler shard with the same
+per-process batch size (weak scaling) over gloo on localhost. Start-up is
+excluded from the timings.
+
+Run from the repository root:
+    python -m benchmarks.bench_gan_ddp [n_images] [batch_size] [max_processes]
+"""
+
+import os
+import sys
+
+from src.gan_distributed import train_gan_ddp
+from src.mnist import TensorMNIST
+
+if __name__ == "__main__":
+    n_images = int(sys.argv[1]) if len(sys.argv) > 1 else 12_800
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    max_processes = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    # an odd size, so the shards end in uneven last batches
+    dataset = TensorMNIST.synthetic(n_images + 1)
+    print("=" * 60)
+    print(f"BENCHMARK: one DDP epoch on {n_images + 1:,} images ({os.cpu_count()} CPUs)")
+    print("=" * 60)
+    baseline = None
+    world_size = 1
+    while world_size <= max_processes:
+        result = train_gan_ddp(world_size, batch_size, 1, dataset=dataset, log_every=0)
+        baseline = baseline or result.images_per_sec
+        print(f"  {world_size} process(es): {result.seconds:7.2f} s  {result.images_per_sec:8.0f} img/s"
+              f"   ({result.images_per_sec / baseline:.2f}x)")
+        world_size *= 2
@@ -0,0 +1,47 @@
+"""
+Benchmark: train_gan throughput with metrics disabled vs enabled
+
+Run from the repository root:
+    python -m benchmarks.bench_gan_metrics [n_images]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import torch
+
+from src.gan_metrics import JsonlSink
+from src.gan_train import train_gan
+from src.mnist import TensorMNIST
+
+
+def images_per_second(dataset: TensorMNIST, **options) -> float:
+    torch.manual_seed(0)
+    start = time.perf_counter()
+    train_gan(64, 1, dataset=dataset, log_every=0, **options)
+    return len(dataset) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    n_images = int(sys.argv[1]) if len(sys.argv) > 1 else 6_400
+    dataset = TensorMNIST.synthetic(n_images)
+    print("=" * 60)
+    print(f"BENCHMARK: metrics overhead over one epoch of {n_images:,} images")
+    print("=" * 60)
+    images_per_second(dataset)  # warm-up
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "metrics.jsonl")
+        with JsonlSink(path) as sink:
+            runs = {
+                "disabled": images_per_second(dataset),
+                "JSONL, every 100 steps": images_per_second(dataset, metrics=sink, metrics_every=100),
+                "JSONL, every step": images_per_second(dataset, metrics=sink, metrics_every=1),
+            }
+        with open(path) as f:
+            last = f.readlines()[-1]
+    base = runs["disabled"]
+    for name, rate in runs.items():
+        print(f"  {name:<24} {rate:8.0f} img/s   ({(rate / base - 1) * 100:+5.1f}%)")
+    print(f"  last record: {last.strip()}")
@@ -0,0 +1,41 @@
+"""
+Benchmark: GAN training epoch with inline batches vs the background prefetcher
+
+Run from the repository root:
+    python -m benchmarks.bench_gan_prefetch [n_images] [batch_size]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+import torch
+
+from src.gan_train import train_gan
+from src.mnist import TensorMNIST
+
+
+def run(dataset: TensorMNIST, batch_size: int, num_workers: int) -> float:
+    torch.manual_seed(0)
+    log = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        train_gan(batch_size, 1, dataset=dataset, num_workers=num_workers, log_every=0)
+    elapsed = time.perf_counter() - start
+    wait = [line for line in log.getvalue().splitlines() if "data wait" in line]
+    print(f"  num_workers={num_workers}:  {elapsed:7.2f} s  {len(dataset) / elapsed:8.0f} img/s  "
+          f"{wait[-1].split(': ', 1)[1] if wait else ''}")
+    return elapsed
+
+
+if __name__ == "__main__":
+    n_images = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    dataset = TensorMNIST.synthetic(n_images)
+    print("=" * 60)
+    print(f"BENCHMARK: one GAN epoch on {n_images:,} images ({os.cpu_count()} CPUs)")
+    print("=" * 60)
+    for num_workers in (0, 1, 2):
+        run(dataset, batch_size, num_workers)
@@ -0,0 +1,43 @@
+"""
+Benchmark: micro-batched GAN sampling under concurrent load
+
+Closed-loop clients request one image at a time from a SamplingService.
+max_batch=1 serves every request with its own forward pass; larger
+max_batch values coalesce whatever is queued. Reports p50/p99 request
+latency and images/sec for each policy.
+
+Run from the repository root:
+    python -m benchmarks.bench_gan_serving [clients] [requests_per_client]
+"""
+
+import asyncio
+import os
+import sys
+
+import torch
+
+from exercise4_gan import Generator
+from src.gan_serving import SamplingService, load_test
+
+POLICIES = [(1, 0.0), (16, 2.0), (64, 2.0), (64, 10.0)]
+
+
+async def main(clients: int, requests_per_client: int) -> None:
+    torch.manual_seed(0)
+    generator = Generator()
+    for max_batch, max_wait_ms in POLICIES:
+        async with SamplingService(generator, max_batch, max_wait_ms) as service:
+            await load_test(service, clients, 2)  # warm-up
+            result = await load_test(service, clients, requests_per_client)
+        print(f"  max_batch={max_batch:<3} max_wait={max_wait_ms:4.1f} ms  p50 {result.p50_ms:7.2f} ms  "
+              f"p99 {result.p99_ms:7.2f} ms  {result.images_per_sec:8.0f} img/s  "
+              f"({result.mean_batch_requests:.1f} requests/batch)")
+
+
+if __name__ == "__main__":
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    requests_per_client = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    print("=" * 60)
+    print(f"BENCHMARK: {clients} clients x {requests_per_client} single-image requests ({os.cpu_count()} CPUs)")
+    print("=" * 60)
+    asyncio.run(main(clients, requests_per_client))
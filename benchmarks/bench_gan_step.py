@@ -0,0 +1,94 @@
+"""
+Benchmark: GAN training throughput of train_gan_fixed's step vs GANStep variants
+
+All variants train on the same synthetic MNIST-shaped batches. The baseline
+is the loop body of exercise4_gan.train_gan_fixed as written (labels built
+with torch.ones/zeros/cat every step); "GANStep(fused=False)" is the same
+step with the preallocated LabelBuffers labels.
+
+Run from the repository root:
+    python -m benchmarks.bench_gan_step [n_steps] [batch_size] [--compile]
+"""
+
+import sys
+import time
+import warnings
+
+import torch
+from torch import nn
+
+from exercise4_gan import Discriminator, Generator
+from src.gan_step import GANStep
+from src.mnist import TensorMNIST
+
+
+def train_gan_fixed_step(lr: float = 0.0001):
+    """One iteration of train_gan_fixed's loop body, on CPU."""
+    discriminator, generator = Discriminator(), Generator()
+    loss_function = nn.BCELoss()
+    optimizer_discriminator = torch.optim.Adam(discriminator.parameters(), lr=lr)
+    optimizer_generator = torch.optim.Adam(generator.parameters(), lr=lr)
+
+    def step(real_samples):
+        actual_batch_size = real_samples.size(0)
+        real_samples_labels = torch.ones((actual_batch_size, 1))
+        latent_space_samples = torch.randn((actual_batch_size, 100))
+        generated_samples = generator(latent_space_samples)
+        generated_samples_labels = torch.zeros((actual_batch_size, 1))
+        all_samples = torch.cat((real_samples, generated_samples))
+        all_samples_labels = torch.cat((real_samples_labels, generated_samples_labels))
+        discriminator.zero_grad()
+        loss_discriminator = loss_function(discriminator(all_samples), all_samples_labels)
+        loss_discriminator.backward()
+        optimizer_discriminator.step()
+
+        latent_space_samples = torch.randn((actual_batch_size, 100))
+        generator.zero_grad()
+        output_discriminator_generated = discriminator(generator(latent_space_samples))
+        loss_generator = loss_function(output_discriminator_generated, real_samples_labels)
+        loss_generator.backward()
+        optimizer_generator.step()
+        return loss_discriminator, loss_generator
+
+    return step
+
+
+def images_per_second(batches, warmup: int = 5, **options) -> float:
+    torch.manual_seed(0)
+    if options.pop("train_gan_fixed", False):
+        step = train_gan_fixed_step()
+    else:
+        step = GANStep(Generator(), Discriminator(), **options)
+    for real in batches[:warmup]:
+        step(real)
+    start = time.perf_counter()
+    for real in batches[warmup:]:
+        step(real)
+    return sum(len(real) for real in batches[warmup:]) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    n_steps = int(args[0]) if args else 100
+    batch_size = int(args[1]) if len(args) > 1 else 64
+    dataset = TensorMNIST.synthetic(n_steps * batch_size, seed=0).normalized()
+    batches = [images for images, _ in dataset.batches(batch_size, shuffle=False)]
+    variants = {
+        "train_gan_fixed loop body": dict(train_gan_fixed=True),
+        "GANStep(fused=False)": dict(fused=False),
+        "fused": dict(),
+        "fused + share_noise": dict(share_noise=True),
+        "fused + bf16 autocast": dict(bf16=True),
+        "fused + TorchScript": dict(compile="script"),
+    }
+    if "--compile" in sys.argv:
+        variants["fused + torch.compile"] = dict(compile="torch")
+    print("=" * 60)
+    print(f"BENCHMARK: GAN step throughput, {n_steps} steps of {batch_size} images")
+    print("=" * 60)
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    baseline = None
+    for name, options in variants.items():
+        rate = images_per_second(batches, **options)
+        baseline = baseline or rate
+        print(f"  {name:<30} {rate:9.0f} img/s   ({rate / baseline:.2f}x)")
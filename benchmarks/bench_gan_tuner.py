@@ -0,0 +1,36 @@
+"""
+Benchmark: GAN throughput with the default settings vs the tuned ones
+
+Runs the tuner over its default grid (writing to a temporary cache, not the
+user's), then times the untuned configuration (all cores, batch size 32,
+no prefetching) and the winner with the same trial length.
+
+Run from the repository root:
+    python -m benchmarks.bench_gan_tuner [steps]
+"""
+
+import os
+import sys
+import tempfile
+
+from src.gan_tuner import tune
+
+if __name__ == "__main__":
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print("=" * 60)
+    print(f"BENCHMARK: tuning grid, {steps} steps per trial ({os.cpu_count()} CPUs)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, "tuning.json")
+        best = tune(steps=steps, cache=cache)
+        # both re-timed as one-point grids, so neither keeps a lucky search result
+        print("=" * 60)
+        cores = os.cpu_count() or 1
+        default = tune({"num_threads": [cores], "interop_threads": [cores], "num_workers": [0], "batch_size": [32]},
+                       steps, cache=cache, verbose=False)
+        tuned = tune({key: [value] for key, value in best._asdict().items() if key != "images_per_sec"},
+                     steps, cache=cache, verbose=False)
+    print(f"  default: threads={cores} interop={cores} workers=0 batch=32   {default.images_per_sec:8.0f} img/s")
+    print(f"  tuned:   threads={tuned.num_threads} interop={tuned.interop_threads} workers={tuned.num_workers} "
+          f"batch={tuned.batch_size}   {tuned.images_per_sec:8.0f} img/s"
+          f"   ({tuned.images_per_sec / default.images_per_sec:.2f}x)")
@@ -0,0 +1,70 @@
+"""
+Benchmark: cumulative import time of the repository modules, with budgets
+
+Each module is imported in a fresh interpreter under ``-X importtime`` and
+its cumulative time is compared to a budget. The run also reports heavy
+packages that an import pulled in. Exits with status 1 if any module
+goes over its budget, so it can gate CI.
+
+Run from the repository root:
+    python -m benchmarks.bench_import_time [--scale FACTOR]
+"""
+
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, Set, Tuple
+
+# module -> budget in milliseconds (cumulative, including dependencies)
+BUDGETS_MS = {
+    "src.fruits": 400,
+    "src.coords": 400,
+    "src.nms": 400,
+    "src.pr_curve": 400,
+    "src.pr_cache": 400,
+    "src.pr_metrics": 400,
+    "verify_setup": 50,
+    "run_all_exercises": 50,
+    "exercise4_gan": 4000,
+}
+HEAVY = ("matplotlib", "torchvision", "IPython", "torch")
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_profile(module: str) -> Tuple[float, Set[str]]:
+    """Cumulative import time of ``module`` in ms and the top-level packages it loaded."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=os.getcwd(), check=True,
+    )
+    total, loaded = 0.0, set()
+    for match in _LINE.finditer(result.stderr):
+        name = match.group(4)
+        loaded.add(name.split(".")[0])
+        if name == module:
+            total = int(match.group(2)) / 1000
+    return total, loaded
+
+
+def check(budgets: Dict[str, float], repeats: int = 3) -> bool:
+    ok = True
+    for module, budget in budgets.items():
+        # the best of a few runs filters out cold-cache noise
+        runs = [import_profile(module) for _ in range(repeats)]
+        elapsed = min(t for t, _ in runs)
+        heavy = sorted(set(HEAVY) & runs[0][1])
+        status = "ok" if elapsed <= budget else "OVER"
+        ok &= elapsed <= budget
+        print(f"  {module:<20} {elapsed:8.1f} ms / {budget:6.0f} ms  {status:<4}  {', '.join(heavy) or '-'}")
+    return ok
+
+
+if __name__ == "__main__":
+    scale = float(sys.argv[sys.argv.index("--scale") + 1]) if "--scale" in sys.argv else 1.0
+    print("=" * 60)
+    print("BENCHMARK: import time per module (best of 3, heavy deps loaded)")
+    print("=" * 60)
+    passed = check({module: budget * scale for module, budget in BUDGETS_MS.items()})
+    print("  all modules within budget" if passed else "  import-time budget exceeded")
+    sys.exit(0 if passed else 1)
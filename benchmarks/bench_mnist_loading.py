@@ -0,0 +1,57 @@
+"""
+Benchmark: one epoch of batches, per-sample PIL transforms vs TensorMNIST
+
+Run from the repository root:
+    python -m benchmarks.bench_mnist_loading [n_images] [batch_size]
+"""
+
+import sys
+import time
+
+import torch
+import torchvision.transforms as transforms
+from PIL import Image
+from torch.utils.data import DataLoader, Dataset
+
+from src.mnist import TensorMNIST
+
+
+class PILMNIST(Dataset):
+    """Same per-sample path as torchvision.datasets.MNIST.__getitem__."""
+
+    def __init__(self, images: torch.Tensor, labels: torch.Tensor):
+        self.images, self.labels = images.squeeze(1), labels
+        self.transform = transforms.Compose([transforms.ToTensor(), transforms.Normalize((0.5,), (0.5,))])
+
+    def __len__(self) -> int:
+        return len(self.images)
+
+    def __getitem__(self, index: int):
+        image = Image.fromarray(self.images[index].numpy(), mode="L")
+        return self.transform(image), int(self.labels[index])
+
+
+def epoch_time(batches) -> float:
+    start = time.perf_counter()
+    for images, _ in batches:
+        pass
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n_images = int(sys.argv[1]) if len(sys.argv) > 1 else 60_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    dataset = TensorMNIST.synthetic(n_images)
+    print("=" * 60)
+    print(f"BENCHMARK: one epoch of {n_images:,} MNIST-shaped images, batch_size={batch_size}")
+    print("=" * 60)
+
+    pil = epoch_time(DataLoader(PILMNIST(dataset.images, dataset.labels), batch_size=batch_size, shuffle=True))
+    loader = epoch_time(DataLoader(dataset, batch_size=batch_size, shuffle=True))
+    sliced = epoch_time(dataset.batches(batch_size))
+    normalized = dataset.normalized()
+    presliced = epoch_time(normalized.batches(batch_size))
+    print(f"  DataLoader + PIL transforms:    {pil:7.2f} s")
+    print(f"  DataLoader over TensorMNIST:    {loader:7.2f} s   ({pil / loader:.1f}x)")
+    print(f"  TensorMNIST.batches (uint8):    {sliced:7.2f} s   ({pil / sliced:.1f}x)")
+    print(f"  TensorMNIST.batches (float32):  {presliced:7.2f} s   ({pil / presliced:.1f}x)")
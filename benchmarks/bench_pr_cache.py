@@ -0,0 +1,45 @@
+"""
+Benchmark: cold vs warm PRCache loads of a large precision/recall CSV
+
+Run from the repository root:
+    python -m benchmarks.bench_pr_cache [n_rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from src.pr_cache import PRCache
+from src.pr_curve import load_precision_recall, save_precision_recall
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    print("=" * 60)
+    print(f"BENCHMARK: loading a {n_rows:,}-row precision/recall CSV")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, "pr.csv")
+        values = np.random.default_rng(0).uniform(size=(2, n_rows))
+        save_precision_recall(csv_file, *values)
+
+        parse, expected = timed(load_precision_recall, csv_file)
+        for hash_content in (False, True):
+            cache = PRCache(os.path.join(tmp, f"cache-{hash_content}"), hash_content=hash_content)
+            cold, _ = timed(cache.load, csv_file)
+            warm, result = timed(cache.load, csv_file)
+            assert all(np.array_equal(a, b) for a, b in zip(expected, result))
+            label = "size+mtime+hash" if hash_content else "size+mtime"
+            print(f"  [{label}]")
+            print(f"    parse only:   {parse:8.3f} s")
+            print(f"    cold (miss):  {cold:8.3f} s")
+            print(f"    warm (mmap):  {warm:8.3f} s   ({parse / warm:.0f}x faster than parsing)")
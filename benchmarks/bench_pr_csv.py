@@ -0,0 +1,53 @@
+"""
+Benchmark: bulk load_precision_recall vs the csv.DictReader row loop
+
+Run from the repository root:
+    python -m benchmarks.bench_pr_csv [n_rows]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from src.pr_curve import iter_precision_recall, load_precision_recall
+
+
+def load_with_dictreader(csv_file: str):
+    """The previous row-by-row implementation, kept for comparison."""
+    precision, recall = [], []
+    with open(csv_file, "r") as f:
+        for row in csv.DictReader(f):
+            precision.append(float(row["precision"]))
+            recall.append(float(row["recall"]))
+    return np.array(precision), np.array(recall)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    print("=" * 60)
+    print(f"BENCHMARK: parsing a {n_rows:,}-row precision/recall CSV")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pr.csv")
+        values = np.random.default_rng(0).uniform(size=(n_rows, 2))
+        with open(path, "w") as f:
+            f.write("precision,recall\n")
+            np.savetxt(f, values, delimiter=",", fmt="%.6f")
+
+        slow, expected = timed(load_with_dictreader, path)
+        fast, result = timed(load_precision_recall, path)
+        stream, chunks = timed(lambda: sum(len(p) for p, _ in iter_precision_recall(path)))
+        assert all(np.array_equal(a, b) for a, b in zip(expected, result))
+        print(f"  csv.DictReader loop:    {slow:8.2f} s")
+        print(f"  load_precision_recall:  {fast:8.2f} s   ({slow / fast:.1f}x)")
+        print(f"  iter_precision_recall:  {stream:8.2f} s   ({chunks:,} rows streamed)")
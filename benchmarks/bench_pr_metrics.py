@@ -0,0 +1,55 @@
+"""
+Benchmark: batched average_precision vs a per-class loop
+
+Run from the repository root:
+    python -m benchmarks.bench_pr_metrics [n_samples] [n_classes]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from src.pr_curve import precision_recall_from_scores
+from src.pr_metrics import average_precision
+
+
+def per_class_loop(scores: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """One precision_recall_from_scores call per class column."""
+    result = np.full((3, scores.shape[1]), np.nan)
+    for c in range(scores.shape[1]):
+        if not labels[:, c].any():
+            continue
+        precision, recall = precision_recall_from_scores(scores[:, c], labels[:, c])
+        gain = np.diff(recall, prepend=0)
+        envelope = np.maximum.accumulate(precision[::-1])[::-1]
+        trapezoids = gain * (precision + np.append(1, precision[:-1])) / 2
+        result[:, c] = (gain * precision).sum(), (gain * envelope).sum(), trapezoids.sum()
+    return result
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    n_samples = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    n_classes = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    rng = np.random.default_rng(0)
+    labels = rng.random((n_samples, n_classes)) < 0.1
+    scores = rng.random((n_samples, n_classes)) + 0.5 * labels
+    print("=" * 60)
+    print(f"BENCHMARK: AP / PR-AUC for {n_samples:,} samples x {n_classes:,} classes")
+    print("=" * 60)
+
+    slow, expected = timed(per_class_loop, scores, labels)
+    fast, result = timed(average_precision, scores, labels)
+    threads = os.cpu_count() or 1
+    pooled, _ = timed(average_precision, scores, labels, n_threads=threads)
+    assert np.allclose(expected, np.stack(result), equal_nan=True)
+    print(f"  per-class loop:            {slow:7.2f} s")
+    print(f"  average_precision:         {fast:7.2f} s   ({slow / fast:.1f}x)")
+    print(f"  average_precision ({threads:>2} th): {pooled:7.2f} s   ({slow / pooled:.1f}x)")
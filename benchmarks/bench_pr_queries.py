@@ -0,0 +1,56 @@
+"""
+Benchmark: PRCurve operating-point queries vs a linear scan per target
+
+Run from the repository root:
+    python -m benchmarks.bench_pr_queries [n_points] [n_queries]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from src.pr_curve import PRCurve
+
+
+def scan_precision_at_recall(precision, recall, targets):
+    """Best precision at recall >= r, one full scan per target."""
+    result = np.full(len(targets), np.nan)
+    for i, target in enumerate(targets):
+        mask = (recall >= target) & np.isfinite(precision)
+        if mask.any():
+            result[i] = precision[mask].max()
+    return result
+
+
+if __name__ == "__main__":
+    n_points = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    rng = np.random.default_rng(0)
+    recall = np.sort(rng.random(n_points))
+    precision = np.clip(1 - recall**2 + rng.normal(0, 0.02, n_points), 0, 1)
+    # PR dumps often hold NaN precision where nothing is predicted
+    precision[-1] = np.nan
+    targets = rng.random(n_queries)
+    print("=" * 60)
+    print(f"BENCHMARK: {n_queries:,} operating-point queries on {n_points:,} points")
+    print("=" * 60)
+
+    scanned = min(n_queries, 200)
+    start = time.perf_counter()
+    expected = scan_precision_at_recall(precision, recall, targets[:scanned])
+    scan = (time.perf_counter() - start) / scanned
+
+    start = time.perf_counter()
+    curve = PRCurve(precision, recall)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    result = curve.precision_at_recall(targets)
+    curve.recall_at_precision(targets)
+    query = (time.perf_counter() - start) / (2 * n_queries)
+    assert np.array_equal(result[:scanned], expected, equal_nan=True)
+    print(f"  linear scan:          {scan * 1e6:10.1f} us / query")
+    print(f"  PRCurve build:        {build:10.3f} s (once)")
+    print(f"  PRCurve query:        {query * 1e6:10.3f} us / query   ({scan / query:,.0f}x)")
+    print(f"  total for {n_queries:,} queries: scan ~{scan * n_queries:.1f} s, "
+          f"PRCurve {build + query * n_queries:.3f} s")
@@ -0,0 +1,58 @@
+"""
+Benchmark: full-resolution pyplot rendering vs decimated headless render_curve
+
+Run from the repository root:
+    python -m benchmarks.bench_pr_render [n_points]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+from src.pr_curve import load_precision_recall, render_curve, render_curves, save_precision_recall  # noqa: E402
+
+
+def render_full(csv_file: str, output: str) -> None:
+    """The plot_data drawing code with every point, saved instead of shown."""
+    precision, recall = load_precision_recall(csv_file)
+    plt.figure(figsize=(6, 6))
+    plt.plot(precision, recall, marker="o")
+    plt.savefig(output)
+    plt.close()
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n_points = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print("=" * 60)
+    print(f"BENCHMARK: rendering a {n_points:,}-point PR curve")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        recall = np.linspace(0, 1, n_points)
+        precision = 1 - recall**3 + 0.01 * np.sin(recall * 500)
+        csv_file = os.path.join(tmp, "pr.csv")
+        save_precision_recall(csv_file, precision, recall)
+
+        full = timed(render_full, csv_file, os.path.join(tmp, "full.png"))
+        lttb = timed(render_curve, csv_file, os.path.join(tmp, "lttb.png"))
+        minmax = timed(render_curve, csv_file, os.path.join(tmp, "minmax.svg"), method="minmax")
+        jobs = [(csv_file, os.path.join(tmp, f"batch{i}.png")) for i in range(8)]
+        serial = timed(render_curves, jobs, workers=1)
+        pooled = timed(render_curves, jobs)
+        print(f"  every point (pyplot):      {full:7.2f} s")
+        print(f"  render_curve lttb PNG:     {lttb:7.2f} s   ({full / lttb:.1f}x)")
+        print(f"  render_curve minmax SVG:   {minmax:7.2f} s")
+        print(f"  8 curves, 1 process:       {serial:7.2f} s")
+        print(f"  8 curves, process pool:    {pooled:7.2f} s   ({os.cpu_count()} CPUs)")
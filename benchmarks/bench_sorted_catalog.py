@@ -0,0 +1,89 @@
+"""
+Benchmark: mixed insert/lookup workload on a changing fruit set
+
+Compares SortedFruitCatalog with re-sorting the set on every lookup
+(id_to_fruit_fixed) and with rebuilding a frozen FruitCatalog after
+every insert.
+
+Run from the repository root:
+    python -m benchmarks.bench_sorted_catalog
+"""
+
+import random
+import time
+
+from exercise1_fruits import id_to_fruit_fixed
+from benchmarks.bench_fruits import make_labels
+from src.fruits import FruitCatalog, SortedFruitCatalog
+
+
+def make_workload(labels: set, ops: int, seed: int = 1) -> list:
+    """Alternating (insert name, lookup id) pairs."""
+    rng = random.Random(seed)
+    fresh = iter(make_labels(len(labels) + ops, seed=seed + 1) - labels)
+    size = len(labels)
+    workload = []
+    for _ in range(ops):
+        workload.append(("add", next(fresh)))
+        size += 1
+        workload.append(("lookup", rng.randrange(size)))
+    return workload
+
+
+def run_sorted_catalog(labels: set, workload: list) -> float:
+    catalog = SortedFruitCatalog(labels)
+    start = time.perf_counter()
+    for op, arg in workload:
+        if op == "add":
+            catalog.add(arg)
+        else:
+            catalog.select(arg)
+    return time.perf_counter() - start
+
+
+def run_per_call_sort(labels: set, workload: list) -> float:
+    fruits = set(labels)
+    start = time.perf_counter()
+    for op, arg in workload:
+        if op == "add":
+            fruits.add(arg)
+        else:
+            id_to_fruit_fixed(arg, fruits)
+    return time.perf_counter() - start
+
+
+def run_rebuild(labels: set, workload: list) -> float:
+    fruits = set(labels)
+    catalog = FruitCatalog(fruits)
+    start = time.perf_counter()
+    for op, arg in workload:
+        if op == "add":
+            fruits.add(arg)
+            catalog = FruitCatalog(fruits)
+        else:
+            catalog.id_to_name(arg)
+    return time.perf_counter() - start
+
+
+def bench(n: int, ops: int, slow_ops: int) -> None:
+    labels = make_labels(n)
+    workload = make_workload(labels, ops)
+    slow_workload = workload[: 2 * slow_ops]
+
+    fast = run_sorted_catalog(labels, workload) / ops
+    resort = run_per_call_sort(labels, slow_workload) / slow_ops
+    rebuild = run_rebuild(labels, slow_workload) / slow_ops
+
+    print(f"\nn = {n:,} labels, one insert + one lookup per op")
+    print(f"  id_to_fruit_fixed (sort per lookup): {resort * 1e6:12.1f} us/op")
+    print(f"  FruitCatalog rebuilt per insert:     {rebuild * 1e6:12.1f} us/op")
+    print(f"  SortedFruitCatalog:                  {fast * 1e6:12.1f} us/op")
+    print(f"  speedup vs per-call sort:            {resort / fast:12.0f}x")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("BENCHMARK: mixed insert + lookup on a mutable fruit set")
+    print("=" * 60)
+    bench(10_000, ops=100_000, slow_ops=100)
+    bench(1_000_000, ops=100_000, slow_ops=3)
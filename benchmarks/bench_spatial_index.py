@@ -0,0 +1,69 @@
+"""
+Benchmark: BoxIndex range / k-nearest queries vs brute-force scans
+
+Run from the repository root:
+    python -m benchmarks.bench_spatial_index [n_boxes]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from src.spatial_index import BoxIndex
+
+
+def brute_query(coords, regions):
+    return [
+        np.flatnonzero(
+            (coords[:, 0] <= r[2]) & (coords[:, 2] >= r[0]) & (coords[:, 1] <= r[3]) & (coords[:, 3] >= r[1])
+        )
+        for r in regions
+    ]
+
+
+def brute_nearest(coords, points, k):
+    result = []
+    for p in points:
+        dx = np.maximum(np.maximum(coords[:, 0] - p[0], p[0] - coords[:, 2]), 0)
+        dy = np.maximum(np.maximum(coords[:, 1] - p[1], p[1] - coords[:, 3]), 0)
+        dist = np.hypot(dx, dy)
+        nearest = np.argpartition(dist, k)[:k]
+        result.append(nearest[np.argsort(dist[nearest])])
+    return result
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    n_boxes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_queries, k = 1_000, 10
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(0, 10_000, size=(n_boxes, 2))
+    wh = rng.uniform(5, 50, size=(n_boxes, 2))
+    coords = np.column_stack([xy, xy + wh, rng.integers(0, 20, n_boxes)])
+    corner = rng.uniform(0, 9_900, size=(n_queries, 2))
+    regions = np.column_stack([corner, corner + 100])
+    points = rng.uniform(0, 10_000, size=(n_queries, 2))
+
+    print("=" * 60)
+    print(f"BENCHMARK: {n_queries:,} queries over {n_boxes:,} boxes")
+    print("=" * 60)
+    build, index = timed(BoxIndex, coords)
+    print(f"  build STR R-tree:            {build * 1e3:10.1f} ms")
+
+    fast, hits = timed(index.query, regions)
+    slow, brute_hits = timed(brute_query, coords, regions)
+    assert all(np.array_equal(a, b) for a, b in zip(hits, brute_hits))
+    print(f"  range query   index: {fast * 1e3:8.1f} ms   brute force: {slow * 1e3:9.1f} ms   ({slow / fast:.0f}x)")
+
+    fast, _ = timed(index.query, regions, classes=3)
+    print(f"  range query (class 3) index: {fast * 1e3:8.1f} ms")
+
+    fast, (nearest, _) = timed(index.nearest, points, k)
+    slow, brute_nearest_ids = timed(brute_nearest, coords, points, k)
+    print(f"  {k}-nearest     index: {fast * 1e3:8.1f} ms   brute force: {slow * 1e3:9.1f} ms   ({slow / fast:.0f}x)")
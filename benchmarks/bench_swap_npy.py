@@ -0,0 +1,55 @@
+"""
+Benchmark: streaming swap_npy over a memory-mapped .npy box file
+
+Run from the repository root:
+    python -m benchmarks.bench_swap_npy [n_rows]
+"""
+
+import filecmp
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from src.coords import swap, swap_npy
+
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000_000
+    print("=" * 60)
+    print(f"BENCHMARK: swap_npy on a ({n_rows:,}, 5) int64 .npy file")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "boxes.npy")
+        ref = os.path.join(tmp, "reference.npy")
+        dst = os.path.join(tmp, "swapped.npy")
+        coords = np.random.default_rng(0).integers(0, 4096, size=(n_rows, 5))
+        np.save(src, coords)
+        np.save(ref, swap(coords))
+        del coords
+
+        for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+            stats = swap_npy(src, dst, chunk_rows=1 << 20, workers=workers)
+            identical = filecmp.cmp(dst, ref, shallow=False)
+            print(
+                f"  workers={workers:<3} {stats.rows_per_sec / 1e6:8.1f} M rows/s"
+                f"  ({stats.seconds:.2f} s, byte-identical: {identical})"
+            )
+
+        # a run with larger chunks, but as many of them, killed after its
+        # last chunk and resumed with smaller ones: the stale progress must
+        # not count the new last chunk (which starts earlier) as done
+        chunk_rows = 1 << 20
+        n_killed = -(-n_rows // chunk_rows)
+        killed_chunk_rows = -(-n_rows // max(n_killed - 1, 1)) - 1
+        last = (n_killed - 1) * killed_chunk_rows
+        out = np.lib.format.open_memmap(dst, mode="w+", dtype=np.int64, shape=(n_rows, 5))
+        out[last:] = np.load(ref, mmap_mode="r")[last:]
+        del out
+        progress = np.zeros(n_killed + 1, dtype=np.int64)
+        progress[0], progress[-1] = killed_chunk_rows, n_rows
+        np.save(dst + ".progress.npy", progress)
+        swap_npy(src, dst, chunk_rows=chunk_rows)
+        identical = filecmp.cmp(dst, ref, shallow=False)
+        print(f"  resumed with a different chunk_rows: byte-identical: {identical}")
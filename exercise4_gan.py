@@ -11,16 +11,9 @@ FIX:
 2. Fix typo in docstring
 """
 
-import csv
-import numpy as np
 import torch
 import torch.nn as nn
 import torch.utils.data
-import torchvision
-import torchvision.transforms as transforms
-import matplotlib.pyplot as plt
-from IPython.display import display, clear_output
-import time
 
 
 class Generator(nn.Module):
@@ -78,6 +71,11 @@ def train_gan_buggy(batch_size: int = 32, num_epochs: int = 2, device: str = "cp
     print(f"\nTraining GAN with batch_size={batch_size}, num_epochs={num_epochs}")
     print("⚠️  This version will fail when batch_size doesn't divide dataset evenly!")
     
+    # torchvision is only needed for the dataset; importing it here keeps
+    # `from exercise4_gan import Generator` cheap for other modules
+    import torchvision
+    import torchvision.transforms as transforms
+
     transform = transforms.Compose([transforms.ToTensor(), transforms.Normalize((0.5,), (0.5,))])
     
     try:
@@ -158,6 +156,9 @@ def train_gan_fixed(batch_size: int = 32, num_epochs: int = 2, device: str = "cp
     print(f"\nTraining GAN with batch_size={batch_size}, num_epochs={num_epochs}")
     print("✓ This version handles variable batch sizes correctly!")
     
+    import torchvision
+    import torchvision.transforms as transforms
+
     transform = transforms.Compose([transforms.ToTensor(), transforms.Normalize((0.5,), (0.5,))])
     
     try:
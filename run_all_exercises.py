@@ -10,17 +10,11 @@ def check_dependencies():
     """Check if required dependencies are installed"""
     missing = []
     
-    # Check numpy (required for exercises 2-3)
-    try:
-        import numpy
-    except ImportError:
-        missing.append("numpy")
-    
-    # Check matplotlib (required for exercise 3)
-    try:
-        import matplotlib
-    except ImportError:
-        missing.append("matplotlib")
+    # numpy is required for exercises 2-3, matplotlib for exercise 3;
+    # find_spec checks they are installed without paying for the import
+    for module_name in ("numpy", "matplotlib"):
+        if importlib.util.find_spec(module_name) is None:
+            missing.append(module_name)
     
     if missing:
         print("\n" + "="*80)
@@ -73,12 +67,10 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # Check if PyTorch is available for Exercise 4
-    try:
-        import torch
-        torch_available = True
+    torch_available = importlib.util.find_spec("torch") is not None
+    if torch_available:
         print("✓ PyTorch detected - Exercise 4 will be included")
-    except ImportError:
-        torch_available = False
+    else:
         print("⚠ PyTorch not found - Exercise 4 will be skipped")
         print("  Install with: pip install torch torchvision")
     
@@ -0,0 +1,165 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+import numpy as np
+from .coords import swap
+
+# Every supported format is a linear map of the xyxy corners
+# [x1, y1, x2, y2]; converting between formats, or through any chain of
+# formats, is therefore a single 4x4 matrix applied to the first four columns
+# (column by column, using only its nonzero coefficients).
+_FORMAT_MATRICES: Dict[str, np.ndarray] = {
+    "xyxy": np.eye(4),
+    "yxyx": np.array([
+        [0, 1, 0, 0],
+        [1, 0, 0, 0],
+        [0, 0, 0, 1],
+        [0, 0, 1, 0],
+    ], dtype=float),
+    "xywh": np.array([
+        [1, 0, 0, 0],
+        [0, 1, 0, 0],
+        [-1, 0, 1, 0],
+        [0, -1, 0, 1],
+    ], dtype=float),
+    "cxcywh": np.array([
+        [0.5, 0, 0.5, 0],
+        [0, 0.5, 0, 0.5],
+        [-1, 0, 1, 0],
+        [0, -1, 0, 1],
+    ]),
+}
+FORMATS = tuple(_FORMAT_MATRICES)
+_SWAP_MATRIX = _FORMAT_MATRICES["yxyx"]
+
+
+def conversion_matrix(*formats: str) -> np.ndarray:
+    """4x4 matrix converting the first format into the last one.
+
+    Intermediate formats of a chain cancel out; they are only validated.
+    """
+    if len(formats) < 2:
+        raise ValueError("At least a source and a target format are required.")
+    for fmt in formats:
+        if fmt not in _FORMAT_MATRICES:
+            raise ValueError(f"Unknown box format {fmt!r}; expected one of {FORMATS}.")
+    matrix = _FORMAT_MATRICES[formats[-1]] @ np.linalg.inv(_FORMAT_MATRICES[formats[0]])
+    # every entry is a multiple of 0.5; drop the float noise from inv()
+    return np.round(matrix * 2) / 2
+
+
+def _terms(matrix: np.ndarray) -> List[List[Tuple[int, Union[int, float]]]]:
+    """Nonzero ``(input column, coefficient)`` pairs of every output column.
+
+    Applying these instead of the full matrix keeps an ``inf`` or ``nan``
+    coordinate out of the output columns that do not depend on it (a matmul
+    would multiply it by 0 and give ``nan``).
+    """
+    return [
+        [(j, int(c) if float(c).is_integer() else float(c)) for j, c in enumerate(row) if c]
+        for row in matrix
+    ]
+
+
+# torch unsigned dtype -> signed dtype holding its values (as NumPy promotes)
+_SIGNED_TORCH_DTYPES = {
+    "torch.uint8": "int16",
+    "torch.uint16": "int32",
+    "torch.uint32": "int64",
+    "torch.uint64": "float64",
+}
+
+
+def _is_tensor(boxes: Any) -> bool:
+    return type(boxes).__module__.split(".")[0] == "torch"
+
+
+def _convert_numpy(boxes: np.ndarray, matrix: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    if np.array_equal(matrix, _SWAP_MATRIX):
+        return swap(boxes, out=out)
+    integral = np.array_equal(matrix, np.round(matrix))
+    if integral or np.issubdtype(boxes.dtype, np.floating):
+        dtype = boxes.dtype
+    else:
+        dtype = np.result_type(boxes.dtype, np.float64)
+    if dtype.kind == "u" and (matrix < 0).any():
+        # widths and heights can be negative: the smallest signed type that
+        # holds every value (float64 for uint64)
+        dtype = np.result_type(dtype, np.int8)
+    if out is None:
+        out = np.empty(boxes.shape, dtype=dtype)
+    elif out.shape != boxes.shape or out.dtype != dtype:
+        raise ValueError(f"out must have shape {boxes.shape} and dtype {dtype}.")
+    if np.array_equal(matrix, np.eye(4)):
+        out[...] = boxes
+        return out
+    corners = boxes[:, :4]
+    if np.shares_memory(corners, out):
+        corners = corners.copy()  # the columns are written one at a time
+    for column, terms in zip(out[:, :4].T, _terms(matrix)):
+        (j, c), rest = terms[0], terms[1:]
+        np.multiply(corners[:, j], dtype.type(c), out=column)
+        for j, c in rest:
+            if c == 1:
+                np.add(column, corners[:, j], out=column)
+            elif c == -1:
+                np.subtract(column, corners[:, j], out=column)
+            else:
+                column += dtype.type(c) * corners[:, j]
+    out[:, 4:] = boxes[:, 4:]
+    return out
+
+
+def _convert_tensor(boxes: Any, matrix: np.ndarray, out: Any) -> Any:
+    import torch
+
+    if np.array_equal(matrix, _SWAP_MATRIX):
+        perm = torch.tensor([1, 0, 3, 2, *range(4, boxes.shape[1])])
+        if out is None:
+            return boxes[:, perm]
+        if out.untyped_storage().data_ptr() == boxes.untyped_storage().data_ptr():
+            # index_select refuses to write over its input
+            return out.copy_(boxes[:, perm])
+        return torch.index_select(boxes, 1, perm, out=out)
+    integral = np.array_equal(matrix, np.round(matrix))
+    dtype = boxes.dtype if integral or boxes.is_floating_point() else torch.get_default_dtype()
+    # torch has no arithmetic kernels for uint16/32/64 at all
+    if str(dtype) in _SIGNED_TORCH_DTYPES and ((matrix < 0).any() or dtype != torch.uint8):
+        dtype = getattr(torch, _SIGNED_TORCH_DTYPES[str(dtype)])
+    if out is None:
+        out = torch.empty(boxes.shape, dtype=dtype)
+    elif tuple(out.shape) != tuple(boxes.shape) or out.dtype != dtype:
+        raise ValueError(f"out must have shape {tuple(boxes.shape)} and dtype {dtype}.")
+    if np.array_equal(matrix, np.eye(4)):
+        return out.copy_(boxes)
+    corners = boxes[:, :4].to(dtype)
+    columns = []
+    for terms in _terms(matrix):
+        (j, c), rest = terms[0], terms[1:]
+        column = corners[:, j] * c if c != 1 else corners[:, j]
+        for j, c in rest:
+            column = torch.add(column, corners[:, j], alpha=c)
+        columns.append(column)
+    # every column is computed before any is written, so out may alias boxes
+    out[:, :4] = torch.stack(columns, 1)
+    out[:, 4:] = boxes[:, 4:]
+    return out
+
+
+def convert(boxes: Any, *formats: str, out: Any = None) -> Any:
+    """Convert ``(N, C)`` boxes between formats in one vectorized pass.
+
+    ``formats`` is a chain such as ``("xyxy", "yxyx", "xywh", "cxcywh")``;
+    the whole chain collapses into one permutation or affine step. Columns
+    from index 4 on (the class id) are copied unchanged. Works on NumPy
+    arrays and CPU torch tensors without converting between the two. The
+    dtype is kept unless the conversion halves integer coordinates, in which
+    case the default float dtype of the library is used, or produces
+    differences of unsigned ones, which are promoted to a signed type
+    (``uint16`` -> ``int32``; ``uint64`` -> ``float64``; torch tensors wider
+    than ``uint8`` always are). ``out`` may be ``boxes`` itself.
+    """
+    if boxes.ndim != 2 or boxes.shape[1] < 5:
+        raise ValueError("boxes must have shape (N, C) with C >= 5.")
+    matrix = conversion_matrix(*formats)
+    if _is_tensor(boxes):
+        return _convert_tensor(boxes, matrix, out)
+    return _convert_numpy(np.asarray(boxes), matrix, out)
@@ -0,0 +1,131 @@
+from typing import Any, Optional, Tuple
+import numpy as np
+
+_CLASS_DTYPE = np.dtype(np.uint16)
+_COORD_DTYPES = (np.dtype(np.float32), np.dtype(np.int16))
+
+
+def _fits(values: np.ndarray, dtype: np.dtype) -> bool:
+    """True if ``values`` survive a round trip through ``dtype``."""
+    if values.size == 0:
+        return True
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        if not np.issubdtype(values.dtype, np.integer) and not np.all(np.isfinite(values)):
+            return False
+        if values.min() < info.min or values.max() > info.max:
+            return False
+    with np.errstate(over="ignore", invalid="ignore"):
+        return bool(np.array_equal(values.astype(dtype).astype(values.dtype), values))
+
+
+class BoxSet:
+    """Struct-of-arrays storage for ``[x1, y1, x2, y2, class_id]`` boxes.
+
+    Coordinates live in one ``(4, N)`` float32 or int16 block and class ids in
+    a uint16 array, i.e. 18 or 10 bytes per box instead of 40 for an int64
+    ``(N, 5)`` array. Each coordinate column is a contiguous zero-copy view,
+    and ``swap`` only permutes which rows are read as x and y.
+    """
+
+    def __init__(
+        self,
+        corners: np.ndarray,
+        class_ids: np.ndarray,
+        order: Tuple[int, int, int, int] = (0, 1, 2, 3),
+        source_dtype: Optional[np.dtype] = None,
+    ):
+        if corners.ndim != 2 or corners.shape[0] != 4:
+            raise ValueError("corners must have shape (4, N).")
+        if corners.dtype not in _COORD_DTYPES:
+            raise TypeError(f"Coordinates must be float32 or int16, got {corners.dtype}.")
+        if class_ids.shape != (corners.shape[1],) or class_ids.dtype != _CLASS_DTYPE:
+            raise ValueError("class_ids must be a uint16 array with one entry per box.")
+        self._corners = corners
+        self._class_ids = class_ids
+        self._order = tuple(order)
+        self.source_dtype = np.dtype(source_dtype if source_dtype is not None else np.int64)
+
+    @classmethod
+    def from_array(cls, coords: np.ndarray, coord_dtype: Any = np.float32) -> "BoxSet":
+        """Build from an ``(N, 5)`` coords array; raises if the cast is lossy."""
+        coords = np.asarray(coords)
+        if coords.ndim != 2 or coords.shape[1] != 5:
+            raise ValueError("coords must have shape (N, 5).")
+        coord_dtype = np.dtype(coord_dtype)
+        if coord_dtype not in _COORD_DTYPES:
+            raise TypeError(f"coord_dtype must be float32 or int16, got {coord_dtype}.")
+        if not _fits(coords[:, :4], coord_dtype):
+            raise ValueError(f"Coordinates cannot be stored losslessly as {coord_dtype}.")
+        if not _fits(coords[:, 4], _CLASS_DTYPE):
+            raise ValueError("Class ids must be integers in [0, 65535].")
+        corners = np.empty((4, len(coords)), dtype=coord_dtype)
+        corners[...] = coords[:, :4].T
+        return cls(corners, coords[:, 4].astype(_CLASS_DTYPE), source_dtype=coords.dtype)
+
+    def to_array(self, dtype: Any = None) -> np.ndarray:
+        """``(N, 5)`` array in ``dtype`` (default: the dtype it was built from)."""
+        out = np.empty((len(self), 5), dtype=dtype or self.source_dtype)
+        for col, row in enumerate(self._order):
+            out[:, col] = self._corners[row]
+        out[:, 4] = self._class_ids
+        return out
+
+    def swap(self) -> "BoxSet":
+        """x <-> y swapped view sharing the same buffers (no data is moved)."""
+        o = self._order
+        return BoxSet(self._corners, self._class_ids, (o[1], o[0], o[3], o[2]), self.source_dtype)
+
+    @property
+    def x1(self) -> np.ndarray:
+        return self._corners[self._order[0]]
+
+    @property
+    def y1(self) -> np.ndarray:
+        return self._corners[self._order[1]]
+
+    @property
+    def x2(self) -> np.ndarray:
+        return self._corners[self._order[2]]
+
+    @property
+    def y2(self) -> np.ndarray:
+        return self._corners[self._order[3]]
+
+    @property
+    def class_ids(self) -> np.ndarray:
+        return self._class_ids
+
+    @property
+    def coord_dtype(self) -> np.dtype:
+        return self._corners.dtype
+
+    def _extent(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        # int16 differences can overflow; widen to int32 for integer storage
+        if self._corners.dtype == np.int16:
+            return hi.astype(np.int32) - lo
+        return hi - lo
+
+    def widths(self) -> np.ndarray:
+        return self._extent(self.x1, self.x2)
+
+    def heights(self) -> np.ndarray:
+        return self._extent(self.y1, self.y2)
+
+    def areas(self) -> np.ndarray:
+        return self.widths() * self.heights()
+
+    def __getitem__(self, index: Any) -> "BoxSet":
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 or None)
+        return BoxSet(self._corners[:, index], self._class_ids[index], self._order, self.source_dtype)
+
+    def __len__(self) -> int:
+        return self._corners.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return self._corners.nbytes + self._class_ids.nbytes
+
+    def __repr__(self) -> str:
+        return f"BoxSet({len(self)} boxes, coords={self._corners.dtype}, order={self._order})"
@@ -0,0 +1,103 @@
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import torch
+
+_STOP = object()
+
+
+def _cpu_copy(value: Any) -> Any:
+    """Deep copy of nested dicts/lists/tuples with every tensor cloned to CPU."""
+    if isinstance(value, torch.Tensor):
+        return value.detach().to("cpu", copy=True)
+    if isinstance(value, dict):
+        return {key: _cpu_copy(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_cpu_copy(item) for item in value)
+    return value
+
+
+def save_checkpoint(state: Dict[str, Any], path: Union[str, Path]) -> Path:
+    """``torch.save`` to a temporary file, then rename it over ``path``.
+
+    Readers (and a resume after a crash mid-write) only ever see the old or
+    the new checkpoint, never a partial one.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    torch.save(state, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_checkpoint(path: Union[str, Path]) -> Dict[str, Any]:
+    # checkpoints hold RNG states and optimizer dicts, not just tensors
+    return torch.load(path, map_location="cpu", weights_only=False)
+
+
+class AsyncCheckpointer:
+    """Checkpoint writer that keeps serialization off the training thread.
+
+    ``save`` snapshots the state on the calling thread (a CPU clone of every
+    tensor, so training may modify the originals right away) and queues it
+    for one background thread that writes it with ``save_checkpoint``. At
+    most one snapshot waits behind the one being written; ``save`` blocks
+    rather than letting snapshots pile up. Errors from the writer are raised
+    by the next ``save``, ``wait`` or ``close``.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.saves = 0
+        self.snapshot_seconds = 0.0
+        self.write_seconds = 0.0
+        self._error: Optional[BaseException] = None
+        self._pending: queue.Queue = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def _write(self) -> None:
+        while True:
+            state = self._pending.get()
+            try:
+                if state is _STOP:
+                    return
+                start = time.perf_counter()
+                save_checkpoint(state, self.path)
+                self.write_seconds += time.perf_counter() - start
+            except BaseException as error:
+                self._error = error
+            finally:
+                self._pending.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Writing checkpoint {self.path} failed.") from error
+
+    def save(self, state: Dict[str, Any]) -> None:
+        self._raise_error()
+        start = time.perf_counter()
+        snapshot = _cpu_copy(state)
+        self.snapshot_seconds += time.perf_counter() - start
+        self._pending.put(snapshot)
+        self.saves += 1
+
+    def wait(self) -> None:
+        """Block until every queued checkpoint is on disk."""
+        self._pending.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        self._pending.put(_STOP)
+        self._thread.join()
+        self._raise_error()
+
+    def __enter__(self) -> "AsyncCheckpointer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
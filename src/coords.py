@@ -1,8 +1,133 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
 import numpy as np
-def swap(coords: np.ndarray) -> np.ndarray:
-    if coords.ndim != 2 or coords.shape[1] != 5:
-        raise ValueError("coords must have shape (N, 5).")
-    swapped = coords.copy()
-    swapped[:, 0], swapped[:, 1] = coords[:, 1], coords[:, 0]
-    swapped[:, 2], swapped[:, 3] = coords[:, 3], coords[:, 2]
-    return swapped
+
+_XY_PERM = np.array([1, 0, 3, 2])
+
+
+def _swap_perm(n_cols: int) -> np.ndarray:
+    return np.concatenate([_XY_PERM, np.arange(4, n_cols)])
+
+
+def swap(
+    coords: np.ndarray,
+    inplace: bool = False,
+    out: Optional[np.ndarray] = None,
+    chunk_rows: int = 65536,
+) -> np.ndarray:
+    if coords.ndim != 2 or coords.shape[1] < 5:
+        raise ValueError("coords must have shape (N, C) with C >= 5.")
+    if out is coords:
+        inplace = True
+    if inplace:
+        # swap through a (chunk_rows, 2) scratch buffer, never a full copy
+        n = coords.shape[0]
+        scratch = np.empty((min(chunk_rows, n), 2), dtype=coords.dtype)
+        for start in range(0, n, chunk_rows):
+            block = coords[start : start + chunk_rows]
+            tmp = scratch[: len(block)]
+            tmp[...] = block[:, 0:4:2]
+            block[:, 0:4:2] = block[:, 1:4:2]
+            block[:, 1:4:2] = tmp
+        return coords
+    perm = _swap_perm(coords.shape[1])
+    if out is None:
+        return np.take(coords, perm, axis=1)
+    if out.shape != coords.shape or out.dtype != coords.dtype:
+        raise ValueError("out must have the same shape and dtype as coords.")
+    if np.may_share_memory(out, coords):
+        raise ValueError("out must not overlap coords; use inplace=True instead.")
+    # mode="clip" lets np.take write straight into out without buffering
+    return np.take(coords, perm, axis=1, out=out, mode="clip")
+
+
+class SwapStats(NamedTuple):
+    rows: int
+    seconds: float
+    rows_per_sec: float
+    chunks_skipped: int
+
+
+# Per-process state for swap_npy workers, set up once by _open_swap_files.
+_swap_files: dict = {}
+
+
+def _open_swap_files(src: str, dst: str, progress: str) -> None:
+    _swap_files["src"] = np.load(src, mmap_mode="r")
+    _swap_files["dst"] = np.load(dst, mmap_mode="r+")
+    _swap_files["progress"] = np.load(progress, mmap_mode="r+")
+
+
+def _swap_chunk(index: int, start: int, stop: int) -> int:
+    swap(_swap_files["src"][start:stop], out=_swap_files["dst"][start:stop])
+    # Marked only after the rows are written; a killed run redoes this chunk.
+    # Entry 0 holds chunk_rows, so chunk i is entry i + 1.
+    _swap_files["progress"][index + 1] = stop
+    return stop - start
+
+
+def swap_npy(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    chunk_rows: int = 1 << 20,
+    workers: Optional[int] = None,
+    resume: bool = True,
+) -> SwapStats:
+    """Stream ``swap`` over an ``.npy`` file that may not fit in memory.
+
+    The input is memory-mapped read-only and ``dst`` is pre-allocated as a
+    memory-mapped ``.npy`` file, so each of the ``workers`` processes only
+    touches ``chunk_rows`` rows at a time. The result is byte-identical to
+    ``np.save(dst, swap(np.load(src)))``. Finished chunks are recorded in
+    ``<dst>.progress.npy`` (``chunk_rows``, then the stop row of every
+    finished chunk or 0); with ``resume`` a partial run continues where it
+    stopped, unless it used a different ``chunk_rows``, in which case it
+    starts over. The progress file is removed once every chunk is written.
+    """
+    src, dst = str(src), str(dst)
+    progress_path = dst + ".progress.npy"
+    coords = np.load(src, mmap_mode="r")
+    if coords.ndim != 2 or coords.shape[1] < 5:
+        raise ValueError("coords must have shape (N, C) with C >= 5.")
+    n = coords.shape[0]
+    chunks = [(i, start, min(start + chunk_rows, n)) for i, start in enumerate(range(0, n, chunk_rows))]
+
+    done = None
+    if resume and os.path.exists(dst) and os.path.exists(progress_path):
+        out = np.load(dst, mmap_mode="r")
+        progress = np.load(progress_path)
+        # stop rows only identify chunks of the same size
+        if (
+            out.shape == coords.shape
+            and out.dtype == coords.dtype
+            and len(progress) == len(chunks) + 1
+            and progress[0] == chunk_rows
+        ):
+            done = progress[1:]
+        del out
+    if done is None:
+        np.lib.format.open_memmap(dst, mode="w+", dtype=coords.dtype, shape=coords.shape)
+        done = np.zeros(len(chunks), dtype=np.int64)
+        np.save(progress_path, np.append(np.int64(chunk_rows), done))
+    del coords
+
+    todo = [chunk for chunk in chunks if done[chunk[0]] != chunk[2]]
+    start_time = time.perf_counter()
+    if workers == 1 or len(todo) <= 1:
+        _open_swap_files(src, dst, progress_path)
+        try:
+            rows = sum(_swap_chunk(*chunk) for chunk in todo)
+        finally:
+            _swap_files.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_open_swap_files, initargs=(src, dst, progress_path)
+        ) as pool:
+            rows = sum(pool.map(_swap_chunk, *zip(*todo)))
+    seconds = time.perf_counter() - start_time
+    os.remove(progress_path)
+    rows_per_sec = rows / seconds if seconds else float("inf")
+    return SwapStats(rows, seconds, rows_per_sec, len(chunks) - len(todo))
@@ -1,7 +1,266 @@
-from typing import List
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+
+class FruitLookupError(IndexError, RuntimeError):
+    """Raised for unknown fruit ids.
+
+    Subclasses both ``IndexError`` (raised by ``id_to_fruit``) and
+    ``RuntimeError`` (raised by ``exercise1_fruits.id_to_fruit_fixed``) so
+    existing ``except`` clauses keep working.
+    """
+
+
 def id_to_fruit(fruit_id: int, fruits: List[str]) -> str:
     if fruit_id < 0 or fruit_id >= len(fruits):
         raise IndexError(
             f"Fruit id {fruit_id} is out of range for list length {len(fruits)}."
         )
     return fruits[fruit_id]
+
+
+def _as_id_array(ids: Any) -> np.ndarray:
+    if not isinstance(ids, np.ndarray) and hasattr(ids, "detach"):
+        # torch tensor: share memory with the CPU tensor instead of copying
+        ids = ids.detach().numpy()
+    ids = np.asarray(ids)
+    if not np.issubdtype(ids.dtype, np.integer):
+        raise TypeError(f"Fruit ids must be integers, got dtype {ids.dtype}.")
+    return ids
+
+
+def _decode(
+    ids: Any, labels: np.ndarray, categorical: bool, mask_invalid: bool
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    ids = _as_id_array(ids)
+    n = len(labels)
+    invalid: Optional[np.ndarray] = None
+    if ids.size:
+        low, high = ids.min(), ids.max()
+        if low < 0 or high >= n:
+            if not mask_invalid:
+                bad = low if low < 0 else high
+                raise FruitLookupError(
+                    f"Fruit id {bad} is out of range for list length {n}."
+                )
+            invalid = (ids < 0) | (ids >= n)
+    if categorical:
+        # a signed copy: -1 must not wrap for unsigned ids, and the caller's
+        # array (or tensor memory) must not be handed back
+        codes = ids.astype(np.intp)
+        if invalid is not None:
+            codes[invalid] = -1
+        return codes, labels
+    if invalid is None:
+        return labels.take(ids)
+    if not n:
+        return np.full(ids.shape, None, dtype=object)
+    decoded = labels.take(np.where(invalid, 0, ids))
+    decoded[invalid] = None
+    return decoded
+
+
+def decode_ids(
+    ids: Any,
+    fruits: Sequence[str],
+    categorical: bool = False,
+    mask_invalid: bool = False,
+) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Vectorized ``id_to_fruit`` for integer ndarrays or CPU torch tensors.
+
+    Returns an object array of names with the shape of ``ids``, or
+    ``(codes, categories)`` when ``categorical`` is set. Out-of-range ids
+    raise ``FruitLookupError`` unless ``mask_invalid`` is set, in which case
+    they decode to ``None`` (code ``-1``).
+    """
+    labels = np.empty(len(fruits), dtype=object)
+    labels[:] = list(fruits)
+    return _decode(ids, labels, categorical, mask_invalid)
+
+
+class FruitCatalog:
+    """Frozen id <-> name index built once from a set or list of fruits.
+
+    Ids follow ``sorted(fruits)``, exactly like ``id_to_fruit_fixed``; pass
+    ``sort=False`` to keep the order of a list as ``id_to_fruit`` does.
+    Lookups in both directions are O(1).
+    """
+
+    def __init__(self, fruits: Iterable[str], sort: bool = True):
+        names = sorted(fruits) if sort else list(fruits)
+        self._names = tuple(names)
+        ids: Dict[str, int] = {}
+        for fruit_id, name in enumerate(names):
+            ids.setdefault(name, fruit_id)
+        self._ids = ids
+        self._labels: Optional[np.ndarray] = None
+
+    def id_to_name(self, fruit_id: int) -> str:
+        if fruit_id < 0 or fruit_id >= len(self._names):
+            raise FruitLookupError(
+                f"Fruit id {fruit_id} is out of range for list length {len(self._names)}."
+            )
+        return self._names[fruit_id]
+
+    def name_to_id(self, name: str) -> int:
+        try:
+            return self._ids[name]
+        except KeyError:
+            raise KeyError(f"Fruit {name!r} is not in the catalog.") from None
+
+    def decode(
+        self, ids: Any, categorical: bool = False, mask_invalid: bool = False
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Batch ``id_to_name``; see ``decode_ids`` for the options."""
+        if self._labels is None:
+            labels = np.empty(len(self._names), dtype=object)
+            labels[:] = self._names
+            self._labels = labels
+        return _decode(ids, self._labels, categorical, mask_invalid)
+
+    @property
+    def names(self) -> tuple:
+        return self._names
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __repr__(self) -> str:
+        return f"FruitCatalog({len(self._names)} fruits)"
+
+
+class SortedFruitCatalog:
+    """Mutable fruit set that keeps ``id_to_fruit_fixed`` ids up to date.
+
+    Names live in a blocked sorted list: sorted blocks of roughly ``load``
+    names plus a Fenwick tree over the block lengths. ``add``, ``discard``,
+    ``rank`` (name -> id) and ``select`` (id -> name) never re-sort the whole
+    set; each costs O(log n) block navigation plus an O(load) list shift.
+    """
+
+    def __init__(self, fruits: Iterable[str] = (), load: int = 512):
+        self._load = load
+        names = sorted(set(fruits))
+        self._members = set(names)
+        self._blocks: List[List[str]] = [
+            names[i : i + load] for i in range(0, len(names), load)
+        ]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        tree = [0] * (len(self._blocks) + 1)
+        for i, block in enumerate(self._blocks, start=1):
+            tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _update(self, block_index: int, delta: int) -> None:
+        tree = self._tree
+        i = block_index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, block_index: int) -> int:
+        tree, total, i = self._tree, 0, block_index
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, fruit_id: int) -> Tuple[int, int]:
+        # Fenwick descent: largest block whose prefix length is <= fruit_id.
+        tree, pos, remaining = self._tree, 0, fruit_id
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] <= remaining:
+                pos = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+        return pos, remaining
+
+    def add(self, name: str) -> None:
+        if name in self._members:
+            return
+        self._members.add(name)
+        blocks, maxes = self._blocks, self._maxes
+        if not blocks:
+            blocks.append([name])
+            maxes.append(name)
+            self._rebuild_index()
+            return
+        b = min(bisect_left(maxes, name), len(blocks) - 1)
+        block = blocks[b]
+        insort(block, name)
+        maxes[b] = block[-1]
+        if len(block) > 2 * self._load:
+            blocks.insert(b + 1, block[self._load :])
+            del block[self._load :]
+            maxes.insert(b, block[-1])
+            self._rebuild_index()
+        else:
+            self._update(b, 1)
+
+    def discard(self, name: str) -> None:
+        if name not in self._members:
+            return
+        self._members.remove(name)
+        b = bisect_left(self._maxes, name)
+        block = self._blocks[b]
+        del block[bisect_left(block, name)]
+        if block:
+            self._maxes[b] = block[-1]
+            self._update(b, -1)
+        else:
+            del self._blocks[b]
+            del self._maxes[b]
+            self._rebuild_index()
+
+    def remove(self, name: str) -> None:
+        if name not in self._members:
+            raise KeyError(f"Fruit {name!r} is not in the catalog.")
+        self.discard(name)
+
+    def rank(self, name: str) -> int:
+        """Id of ``name``, i.e. its position in ``sorted(fruits)``."""
+        if name not in self._members:
+            raise KeyError(f"Fruit {name!r} is not in the catalog.")
+        b = bisect_left(self._maxes, name)
+        return self._prefix(b) + bisect_left(self._blocks[b], name)
+
+    def select(self, fruit_id: int) -> str:
+        """Name with id ``fruit_id``; same result as ``id_to_fruit_fixed``."""
+        if fruit_id < 0 or fruit_id >= len(self._members):
+            raise FruitLookupError(
+                f"Fruit id {fruit_id} is out of range for list length {len(self._members)}."
+            )
+        b, offset = self._locate(fruit_id)
+        return self._blocks[b][offset]
+
+    id_to_name = select
+    name_to_id = rank
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[str]:
+        for block in self._blocks:
+            yield from block
+
+    def __repr__(self) -> str:
+        return f"SortedFruitCatalog({len(self._members)} fruits)"
+
@@ -0,0 +1,114 @@
+import os
+import socket
+import tempfile
+import time
+from typing import Any, Dict, NamedTuple, Optional
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+from torch.nn.parallel import DistributedDataParallel
+from torch.utils.data.distributed import DistributedSampler
+from exercise4_gan import Discriminator, Generator
+from .gan_step import GANStep
+from .mnist import TensorMNIST
+
+
+class DDPResult(NamedTuple):
+    generator: Generator
+    discriminator: Discriminator
+    seconds: float
+    images_per_sec: float
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _ddp_worker(rank: int, world_size: int, port: int, config: Dict[str, Any], result_path: str) -> None:
+    torch.set_num_threads(config["threads"])
+    dist.init_process_group(
+        "gloo", init_method=f"tcp://127.0.0.1:{port}", rank=rank, world_size=world_size
+    )
+    try:
+        dataset = config["dataset"] or TensorMNIST.from_idx(config["root"])
+        # DDP broadcasts rank 0's initial weights; noise and dropout differ per rank
+        torch.manual_seed(config["seed"])
+        generator, discriminator = Generator(), Discriminator()
+        step = GANStep(
+            generator, discriminator, config["lr"], fused=config["fused"], bf16=config["bf16"],
+            wrap=DistributedDataParallel,
+        )
+        torch.manual_seed(config["seed"] + 1 + rank)
+        # pads every rank to the same number of samples, so all ranks run the
+        # same number of steps; the last batch may still be smaller than
+        # batch_size, which GANStep handles
+        sampler = DistributedSampler(dataset, world_size, rank, shuffle=True, seed=config["seed"])
+        batch_size, log_every = config["batch_size"], config["log_every"]
+
+        dist.barrier()
+        start = time.perf_counter()
+        for epoch in range(config["num_epochs"]):
+            sampler.set_epoch(epoch)
+            order = torch.tensor(list(sampler))
+            for n, begin in enumerate(range(0, len(order), batch_size)):
+                real_samples, _ = dataset.batch(order[begin : begin + batch_size])
+                loss_discriminator, loss_generator = step(real_samples)
+                if rank == 0 and log_every and n % log_every == 0:
+                    print(f"Epoch {epoch}, Batch {n}: D_loss={loss_discriminator.item():.4f}, G_loss={loss_generator.item():.4f}")
+        dist.barrier()
+        seconds = time.perf_counter() - start
+
+        if rank == 0:
+            images = len(sampler) * world_size * config["num_epochs"]
+            torch.save(
+                {
+                    "generator": generator.state_dict(),
+                    "discriminator": discriminator.state_dict(),
+                    "seconds": seconds,
+                    "images_per_sec": images / seconds,
+                },
+                result_path,
+            )
+    finally:
+        dist.destroy_process_group()
+
+
+def train_gan_ddp(
+    world_size: int = 2,
+    batch_size: int = 32,
+    num_epochs: int = 2,
+    dataset: Optional[TensorMNIST] = None,
+    root: str = ".",
+    lr: float = 0.0001,
+    log_every: int = 100,
+    threads_per_process: Optional[int] = None,
+    fused: bool = True,
+    bf16: bool = False,
+    seed: int = 0,
+) -> DDPResult:
+    """Data-parallel ``train_gan`` over ``world_size`` local CPU processes.
+
+    The processes talk over the gloo backend on 127.0.0.1. Both models are
+    wrapped in ``DistributedDataParallel``, and every rank trains on its
+    ``DistributedSampler`` shard with ``batch_size`` images per step, so one
+    global step covers ``world_size * batch_size`` images. Each process uses
+    ``threads_per_process`` intra-op threads, which defaults to an even
+    share of the cores. Returns the trained models from rank 0 and the
+    training time, excluding process start-up.
+    """
+    threads = threads_per_process or max(1, (os.cpu_count() or 1) // world_size)
+    config = {
+        "dataset": dataset, "root": root, "batch_size": batch_size, "num_epochs": num_epochs,
+        "lr": lr, "log_every": log_every, "threads": threads, "fused": fused, "bf16": bf16,
+        "seed": seed,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        result_path = os.path.join(tmp, "result.pt")
+        mp.spawn(_ddp_worker, args=(world_size, _free_port(), config, result_path), nprocs=world_size)
+        result = torch.load(result_path, weights_only=True)
+    generator, discriminator = Generator(), Discriminator()
+    generator.load_state_dict(result["generator"])
+    discriminator.load_state_dict(result["discriminator"])
+    return DDPResult(generator, discriminator, result["seconds"], result["images_per_sec"])
@@ -0,0 +1,155 @@
+import csv
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+import torch
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PHASES = ("data_wait", "d_forward", "d_backward", "d_step", "g_forward", "g_backward", "g_step")
+MetricsCallback = Callable[[Dict[str, Any]], None]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB (``None`` where unsupported)."""
+    if resource is None:
+        return None
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class PhaseTimer:
+    """Accumulates wall time per training phase between ``mark`` calls.
+
+    Each ``mark(phase)`` charges the time since the previous mark (or
+    ``restart``) to ``phase``. On CUDA pass ``synchronize`` (e.g.
+    ``torch.cuda.synchronize``) so queued kernels are charged to the phase
+    that launched them.
+    """
+
+    def __init__(self, synchronize: Optional[Callable[[], None]] = None):
+        self.synchronize = synchronize
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self._last = time.perf_counter()
+
+    def restart(self) -> None:
+        self._last = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        if self.synchronize is not None:
+            self.synchronize()
+        now = time.perf_counter()
+        self.totals[phase] += now - self._last
+        self._last = now
+
+    def reset(self) -> None:
+        self.totals = dict.fromkeys(PHASES, 0.0)
+
+
+class TrainingMonitor:
+    """Per-interval step metrics for a GAN training loop.
+
+    ``step_done`` adds the losses to running on-device sums; only every
+    ``every`` steps are they read back (one ``.item()`` per loss) and a
+    record is passed to ``callback``: epoch, step, mean losses, images/sec,
+    mean milliseconds per phase (see ``PHASES``) and peak RSS. ``every=1``
+    gives one record per step.
+    """
+
+    def __init__(self, callback: MetricsCallback, every: int = 100, device: str = "cpu"):
+        self.callback = callback
+        self.every = every
+        sync = torch.cuda.synchronize if torch.device(device).type == "cuda" else None
+        self.timer = PhaseTimer(sync)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._loss_d: Union[torch.Tensor, float] = 0.0
+        self._loss_g: Union[torch.Tensor, float] = 0.0
+        self._steps = 0
+        self._images = 0
+        self._start = time.perf_counter()
+        self.timer.reset()
+
+    def epoch_start(self) -> None:
+        """Start the data-wait clock for the first batch of an epoch."""
+        self.timer.restart()
+
+    def data_ready(self) -> None:
+        self.timer.mark("data_wait")
+
+    def step_done(self, epoch: int, step: int, loss_d: torch.Tensor, loss_g: torch.Tensor, images: int) -> None:
+        self._loss_d = self._loss_d + loss_d
+        self._loss_g = self._loss_g + loss_g
+        self._steps += 1
+        self._images += images
+        if self._steps >= self.every:
+            self.flush(epoch, step)
+        self.timer.restart()
+
+    def flush(self, epoch: int, step: int) -> None:
+        """Emit a record for the steps since the last one, if there are any."""
+        if not self._steps:
+            return
+        elapsed = time.perf_counter() - self._start
+        record: Dict[str, Any] = {
+            "epoch": epoch,
+            "step": step,
+            "steps": self._steps,
+            "loss_d": float(self._loss_d) / self._steps,
+            "loss_g": float(self._loss_g) / self._steps,
+            "images_per_sec": self._images / elapsed if elapsed else 0.0,
+        }
+        for phase, seconds in self.timer.totals.items():
+            record[f"{phase}_ms"] = seconds * 1e3 / self._steps
+        record["peak_rss_mb"] = peak_rss_mb()
+        self.callback(record)
+        self._reset()
+
+
+class JsonlSink:
+    """Metrics callback appending one JSON object per record to ``path``."""
+
+    def __init__(self, path: Union[str, Path]):
+        self._file = open(path, "a")
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CsvSink:
+    """Metrics callback writing records as CSV rows; the header comes from the first record."""
+
+    def __init__(self, path: Union[str, Path]):
+        self._file = open(path, "w", newline="")
+        self._writer: Optional[csv.DictWriter] = None
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(record))
+            self._writer.writeheader()
+        self._writer.writerow(record)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "CsvSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,216 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
+import numpy as np
+import torch
+from exercise4_gan import Generator
+from .gan_step import LATENT_DIM
+
+# (images, latent or None, caller's future, arrival time)
+_Request = Tuple[int, Optional[torch.Tensor], asyncio.Future, float]
+
+
+class SamplingService:
+    """Asyncio front end that batches ``Generator`` sampling requests.
+
+    ``sample`` queues a request and awaits its images. One batcher task
+    takes the oldest request and keeps adding queued ones until they hold
+    ``max_batch`` images or ``max_wait_ms`` have passed since the oldest
+    arrived, then runs a single forward pass under ``torch.inference_mode``
+    on a dedicated worker thread (the event loop stays free to accept
+    requests meanwhile) and hands each caller its slice of the output.
+    A request larger than ``max_batch`` is run on its own. ``batches`` and
+    ``requests`` count the work done, so ``requests / batches`` is the
+    mean coalescing factor.
+    """
+
+    def __init__(
+        self,
+        generator: Generator,
+        max_batch: int = 64,
+        max_wait_ms: float = 5.0,
+        device: str = "cpu",
+    ):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1.")
+        self.generator = generator.to(device).eval()
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1e3
+        self.device = device
+        self.dtype = next(self.generator.parameters()).dtype
+        self.batches = 0
+        self.requests = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._carry: Optional[_Request] = None
+        self._batch: List[_Request] = []
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gan-sampler")
+        self._task = asyncio.create_task(self._batcher())
+
+    async def stop(self) -> None:
+        """Stop batching; requests still queued fail with ``RuntimeError``."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        pending = self._batch + ([self._carry] if self._carry is not None else [])
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, _, future, _ in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("The sampling service was stopped."))
+        # waiting for an in-flight forward pass here would block the event loop
+        self._executor.shutdown(wait=False)
+        self._task = self._carry = None
+        self._batch = []
+
+    async def __aenter__(self) -> "SamplingService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def sample(self, n: int = 1, latent: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """``n`` generated images, shape ``(n, 1, 28, 28)``.
+
+        ``latent`` (a floating tensor of shape ``(n, LATENT_DIM)``, cast to
+        the generator's dtype and device) fixes the noise; by default it is
+        drawn with the batch. The result is a view of the batch output.
+        Invalid requests raise ``ValueError`` here, before they can join a
+        batch with other callers' requests.
+        """
+        if self._task is None:
+            raise RuntimeError("The sampling service is not running; call start() first.")
+        if latent is not None:
+            if latent.dim() != 2 or latent.size(1) != LATENT_DIM:
+                raise ValueError(f"latent must have shape (n, {LATENT_DIM}), got {tuple(latent.shape)}.")
+            if not latent.is_floating_point():
+                raise ValueError(f"latent must be a floating tensor, got {latent.dtype}.")
+            # converted here so the batched torch.cat cannot fail for other callers
+            latent = latent.to(self.device, self.dtype)
+            n = latent.size(0)
+        if n < 1:
+            raise ValueError(f"n must be at least 1, got {n}.")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((n, latent, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> None:
+        """Fill ``_batch`` with the oldest request plus whatever fits before the deadline."""
+        first = self._carry or await self._queue.get()
+        self._carry = None
+        # kept on the instance, so stop() can fail requests taken off the queue
+        batch = self._batch = [first]
+        size = first[0]
+        # measured from arrival, so time spent queued behind the previous
+        # forward pass counts towards the wait
+        deadline = first[3] + self.max_wait
+        while size < self.max_batch:
+            try:
+                request = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if size + request[0] > self.max_batch:
+                self._carry = request  # opens the next batch instead
+                break
+            batch.append(request)
+            size += request[0]
+
+    def _forward(self, batch: List[_Request]) -> torch.Tensor:
+        n = sum(request[0] for request in batch)
+        with torch.inference_mode():
+            if all(request[1] is None for request in batch):
+                latent = torch.randn((n, LATENT_DIM), device=self.device, dtype=self.dtype)
+            else:
+                latent = torch.cat([
+                    torch.randn((size, LATENT_DIM), device=self.device, dtype=self.dtype) if z is None else z
+                    for size, z, _, _ in batch
+                ])
+            return self.generator(latent)
+
+    async def _batcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._collect()
+            # callers that gave up while queued need no images
+            batch = self._batch = [request for request in self._batch if not request[2].cancelled()]
+            if not batch:
+                continue
+            try:
+                images = await loop.run_in_executor(self._executor, self._forward, batch)
+            except Exception as error:
+                for _, _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                self._batch = []
+                continue
+            self.batches += 1
+            self.requests += len(batch)
+            start = 0
+            for size, _, future, _ in batch:
+                if not future.done():
+                    future.set_result(images[start : start + size])
+                start += size
+            self._batch = []
+
+
+class LoadTestResult(NamedTuple):
+    requests: int
+    images: int
+    seconds: float
+    p50_ms: float
+    p99_ms: float
+    images_per_sec: float
+    mean_batch_requests: float
+
+
+async def load_test(
+    service: SamplingService,
+    clients: int = 32,
+    requests_per_client: int = 50,
+    images_per_request: int = 1,
+) -> LoadTestResult:
+    """Closed-loop load on a running ``service``.
+
+    ``clients`` concurrent callers each send ``requests_per_client``
+    requests of ``images_per_request`` images, one after the other.
+    Reports the p50/p99 request latency and the overall images/sec.
+    """
+    latencies: List[float] = []
+    batches, requests = service.batches, service.requests
+
+    async def client() -> None:
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            await service.sample(images_per_request)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    seconds = time.perf_counter() - start
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    n_batches = service.batches - batches
+    return LoadTestResult(
+        requests=len(latencies),
+        images=len(latencies) * images_per_request,
+        seconds=seconds,
+        p50_ms=float(p50),
+        p99_ms=float(p99),
+        images_per_sec=len(latencies) * images_per_request / seconds,
+        mean_batch_requests=(service.requests - requests) / n_batches if n_batches else 0.0,
+    )
@@ -0,0 +1,199 @@
+import contextlib
+from typing import Callable, Dict, Optional, Tuple
+import torch
+import torch.nn as nn
+from .gan_metrics import PhaseTimer
+from .prefetch import LabelBuffers
+
+LATENT_DIM = 100
+COMPILE_MODES = (None, "torch", "script")
+
+
+def _compiled(model: nn.Module, compile: Optional[str]) -> nn.Module:
+    if compile not in COMPILE_MODES:
+        raise ValueError(f"compile must be one of {COMPILE_MODES}, got {compile!r}.")
+    if compile == "torch":
+        return torch.compile(model)
+    if compile == "script":
+        return torch.jit.script(model)
+    return model
+
+
+class GANStep:
+    """One discriminator + generator update, as in ``train_gan_fixed``.
+
+    ``fused=False`` is the reference step: ``train_gan_fixed``'s updates,
+    but with the preallocated ``LabelBuffers`` targets instead of
+    ``torch.ones``/``torch.zeros``/``torch.cat`` every step (the benchmark
+    times the original loop body separately). ``fused=True`` gives the same
+    updates with less work: the discriminator step runs the generator under
+    ``no_grad`` (its gradients were discarded by ``generator.zero_grad()``
+    anyway), noise is drawn into a reused buffer, real and fake samples are
+    concatenated into a reused buffer, the generator step skips the
+    discriminator's weight gradients, and gradients are released with
+    ``zero_grad(set_to_none=True)``. In float32 without ``compile`` the two
+    modes produce identical parameters.
+
+    ``share_noise=True`` additionally keeps the graph of the single fake
+    batch and reuses it for the generator step, which saves one generator
+    forward pass. That is equivalent in distribution (the generator is not
+    updated in between) but consumes one noise draw per step instead of two.
+
+    ``compile`` wraps both models with ``torch.compile`` ("torch") or
+    TorchScript ("script"); ``bf16=True`` runs the forward passes under CPU
+    bfloat16 autocast. ``wrap`` is applied to both models after that, e.g.
+    ``DistributedDataParallel``. Calls return the detached
+    ``(loss_d, loss_g)``. With ``timer`` set, every phase of the step is
+    charged to it.
+    """
+
+    def __init__(
+        self,
+        generator: nn.Module,
+        discriminator: nn.Module,
+        lr: float = 0.0001,
+        device: str = "cpu",
+        fused: bool = True,
+        share_noise: bool = False,
+        compile: Optional[str] = None,
+        bf16: bool = False,
+        wrap: Optional[Callable[[nn.Module], nn.Module]] = None,
+    ):
+        if share_noise and not fused:
+            raise ValueError("share_noise requires fused=True.")
+        self.generator = generator
+        self.discriminator = discriminator
+        self.device = device
+        self.fused = fused
+        self.share_noise = share_noise
+        self.optimizer_generator = torch.optim.Adam(generator.parameters(), lr=lr)
+        self.optimizer_discriminator = torch.optim.Adam(discriminator.parameters(), lr=lr)
+        self.loss_function = nn.BCELoss()
+        self.labels = LabelBuffers(device)
+        # passes whose gradients are used go through ``wrap`` (e.g. DDP);
+        # the no-grad generator pass and the frozen discriminator pass of the
+        # fused step do not need gradient synchronization
+        self._g_plain = _compiled(generator, compile)
+        self._d_plain = _compiled(discriminator, compile)
+        self._g = wrap(self._g_plain) if wrap is not None else self._g_plain
+        self._d = wrap(self._d_plain) if wrap is not None else self._d_plain
+        self._autocast = (
+            (lambda: torch.autocast("cpu", dtype=torch.bfloat16)) if bf16 else contextlib.nullcontext
+        )
+        self._noise: Dict[int, torch.Tensor] = {}
+        self._samples: Dict[int, torch.Tensor] = {}
+        # a PhaseTimer (see gan_metrics) to time the phases of each step
+        self.timer: Optional[PhaseTimer] = None
+
+    def state_dict(self) -> Dict[str, Dict]:
+        """Model and optimizer state, i.e. everything the step updates."""
+        return {
+            "generator": self.generator.state_dict(),
+            "discriminator": self.discriminator.state_dict(),
+            "optimizer_generator": self.optimizer_generator.state_dict(),
+            "optimizer_discriminator": self.optimizer_discriminator.state_dict(),
+        }
+
+    def load_state_dict(self, state: Dict[str, Dict]) -> None:
+        self.generator.load_state_dict(state["generator"])
+        self.discriminator.load_state_dict(state["discriminator"])
+        self.optimizer_generator.load_state_dict(state["optimizer_generator"])
+        self.optimizer_discriminator.load_state_dict(state["optimizer_discriminator"])
+
+    def __call__(self, real_samples: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        real_samples = real_samples.to(device=self.device)
+        if self.fused:
+            return self._fused_step(real_samples)
+        return self._reference_step(real_samples)
+
+    def _reference_step(self, real_samples: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        actual_batch_size = real_samples.size(0)
+        all_samples_labels, real_samples_labels, _ = self.labels.get(actual_batch_size)
+        timer = self.timer
+        with self._autocast():
+            latent_space_samples = torch.randn((actual_batch_size, LATENT_DIM), device=self.device)
+            generated_samples = self._g(latent_space_samples)
+            all_samples = torch.cat((real_samples, generated_samples))
+            self.discriminator.zero_grad()
+            output_discriminator = self._d(all_samples)
+            loss_discriminator = self.loss_function(output_discriminator, all_samples_labels)
+        if timer is not None:
+            timer.mark("d_forward")
+        loss_discriminator.backward()
+        if timer is not None:
+            timer.mark("d_backward")
+        self.optimizer_discriminator.step()
+        if timer is not None:
+            timer.mark("d_step")
+
+        with self._autocast():
+            latent_space_samples = torch.randn((actual_batch_size, LATENT_DIM), device=self.device)
+            self.generator.zero_grad()
+            generated_samples = self._g(latent_space_samples)
+            output_discriminator_generated = self._d(generated_samples)
+            loss_generator = self.loss_function(output_discriminator_generated, real_samples_labels)
+        if timer is not None:
+            timer.mark("g_forward")
+        loss_generator.backward()
+        if timer is not None:
+            timer.mark("g_backward")
+        self.optimizer_generator.step()
+        if timer is not None:
+            timer.mark("g_step")
+        return loss_discriminator.detach(), loss_generator.detach()
+
+    def _buffers(self, n: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        noise = self._noise.get(n)
+        if noise is None:
+            noise = self._noise[n] = torch.empty((n, LATENT_DIM), device=self.device)
+            self._samples[n] = torch.empty((2 * n, 1, 28, 28), device=self.device)
+        return noise, self._samples[n]
+
+    def _fused_step(self, real_samples: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        n = real_samples.size(0)
+        all_labels, real_labels, _ = self.labels.get(n)
+        noise, samples = self._buffers(n)
+        timer = self.timer
+
+        torch.randn((n, LATENT_DIM), out=noise)
+        with self._autocast():
+            if self.share_noise:
+                generated = self._g(noise)
+            else:
+                with torch.no_grad():
+                    generated = self._g_plain(noise)
+        torch.cat((real_samples, generated.detach().to(samples.dtype)), out=samples)
+        self.optimizer_discriminator.zero_grad(set_to_none=True)
+        with self._autocast():
+            loss_discriminator = self.loss_function(self._d(samples), all_labels)
+        if timer is not None:
+            timer.mark("d_forward")
+        loss_discriminator.backward()
+        if timer is not None:
+            timer.mark("d_backward")
+        self.optimizer_discriminator.step()
+        if timer is not None:
+            timer.mark("d_step")
+
+        if not self.share_noise:
+            torch.randn((n, LATENT_DIM), out=noise)
+        self.optimizer_generator.zero_grad(set_to_none=True)
+        # the discriminator's weight gradients from this pass would be cleared
+        # before they are used, so backward only flows through to its input
+        self.discriminator.requires_grad_(False)
+        try:
+            with self._autocast():
+                if not self.share_noise:
+                    generated = self._g(noise)
+                loss_generator = self.loss_function(self._d_plain(generated), real_labels)
+            if timer is not None:
+                timer.mark("g_forward")
+            loss_generator.backward()
+        finally:
+            self.discriminator.requires_grad_(True)
+        if timer is not None:
+            timer.mark("g_backward")
+        self.optimizer_generator.step()
+        if timer is not None:
+            timer.mark("g_step")
+        return loss_discriminator.detach(), loss_generator.detach()
@@ -0,0 +1,133 @@
+from typing import Any, Dict, Optional, Tuple, Union
+import torch
+from exercise4_gan import Discriminator, Generator
+from .checkpoint import AsyncCheckpointer, load_checkpoint
+from .gan_metrics import MetricsCallback, TrainingMonitor
+from .gan_step import GANStep
+from .gan_tuner import DEFAULT_CACHE, apply_tuned, load_tuned, tune
+from .mnist import TensorMNIST
+from .prefetch import BatchPrefetcher
+
+
+def train_gan(
+    batch_size: int = 32,
+    num_epochs: int = 2,
+    device: str = "cpu",
+    dataset: Optional[TensorMNIST] = None,
+    root: str = ".",
+    lr: float = 0.0001,
+    log_every: int = 100,
+    num_workers: int = 0,
+    prefetch_depth: int = 2,
+    fused: bool = True,
+    share_noise: bool = False,
+    compile: Optional[str] = None,
+    bf16: bool = False,
+    checkpoint: Optional[str] = None,
+    checkpoint_every: int = 500,
+    resume: Optional[str] = None,
+    metrics: Optional[MetricsCallback] = None,
+    metrics_every: int = 100,
+    tuned: Union[bool, str] = False,
+) -> Tuple[Generator, Discriminator]:
+    """``train_gan_fixed`` on a tensor-resident dataset.
+
+    ``dataset`` defaults to the local MNIST IDX files under ``root`` (no
+    download); pass ``TensorMNIST.synthetic()`` to run without them.
+    Batches come straight from ``TensorMNIST.batches``, so there is no
+    per-sample transform. With ``num_workers > 0`` a ``BatchPrefetcher``
+    prepares the next ``prefetch_depth`` batches per worker in the
+    background and the running data-wait fraction is printed after each
+    epoch. ``fused``, ``share_noise``, ``compile`` and ``bf16`` select the
+    ``GANStep`` variant.
+
+    With ``checkpoint`` the models, both optimizers, the RNG states and the
+    data position are written there every ``checkpoint_every`` steps and at
+    the end, by a background ``AsyncCheckpointer``. ``resume`` continues
+    from such a file exactly where it stopped: with the same arguments
+    (including ``num_workers``) the result is bit-identical to an
+    uninterrupted run.
+
+    ``metrics`` (e.g. a ``JsonlSink`` or ``CsvSink``) receives a
+    ``TrainingMonitor`` record every ``metrics_every`` steps: mean losses,
+    images/sec, per-phase step times and peak RSS. Without it no timing
+    is done.
+
+    ``tuned=True`` (or the path of a tuning cache) replaces ``batch_size``,
+    ``num_workers`` and torch's thread counts with the settings
+    ``gan_tuner.tune`` stored for this host, running the tuner first if
+    there are none yet. Returns the trained generator and discriminator.
+    """
+    if tuned:
+        cache = DEFAULT_CACHE if tuned is True else tuned
+        config = load_tuned(cache) or tune(cache=cache)
+        apply_tuned(config)
+        batch_size, num_workers = config.batch_size, config.num_workers
+        print(f"Tuned settings: {config.num_threads} threads, batch size {batch_size}, {num_workers} workers")
+    if dataset is None:
+        dataset = TensorMNIST.from_idx(root)
+    # shuffling has its own generator so its state can be saved per epoch
+    shuffle = torch.Generator().manual_seed(torch.initial_seed())
+    prefetcher = None
+    if num_workers > 0:
+        prefetcher = BatchPrefetcher(dataset, batch_size, num_workers, prefetch_depth, device, generator=shuffle)
+    discriminator = Discriminator().to(device)
+    generator = Generator().to(device)
+    step = GANStep(generator, discriminator, lr, device, fused, share_noise, compile, bf16)
+    first_epoch, start_batch, steps = 0, 0, 0
+    if resume is not None:
+        state = load_checkpoint(resume)
+        step.load_state_dict(state["step"])
+        shuffle.set_state(state["shuffle_rng"])
+        torch.set_rng_state(state["torch_rng"])
+        first_epoch, start_batch, steps = state["epoch"], state["next_batch"], state["steps"]
+    writer = AsyncCheckpointer(checkpoint) if checkpoint is not None else None
+    monitor = None
+    if metrics is not None:
+        monitor = TrainingMonitor(metrics, metrics_every, device)
+        step.timer = monitor.timer
+
+    def position(epoch: int, next_batch: int, shuffle_state: torch.Tensor) -> Dict[str, Any]:
+        return {
+            "step": step.state_dict(),
+            "torch_rng": torch.get_rng_state(),
+            # the shuffle state at the start of the epoch redraws its permutation
+            "shuffle_rng": shuffle_state,
+            "epoch": epoch,
+            "next_batch": next_batch,
+            "steps": steps,
+        }
+
+    try:
+        for epoch in range(first_epoch, num_epochs):
+            epoch_shuffle_state = shuffle.get_state()
+            if prefetcher is not None:
+                batches = prefetcher.epoch(start_batch)
+            else:
+                batches = dataset.batches(batch_size, generator=shuffle, start_batch=start_batch)
+            if monitor is not None:
+                monitor.epoch_start()
+            for n, (real_samples, mnist_labels) in enumerate(batches, start_batch):
+                if monitor is not None:
+                    monitor.data_ready()
+                loss_discriminator, loss_generator = step(real_samples)
+                steps += 1
+                if monitor is not None:
+                    monitor.step_done(epoch, steps, loss_discriminator, loss_generator, len(real_samples))
+                if log_every and n % log_every == 0:
+                    print(f"Epoch {epoch}, Batch {n}: D_loss={loss_discriminator.item():.4f}, G_loss={loss_generator.item():.4f}")
+                if writer is not None and checkpoint_every and steps % checkpoint_every == 0:
+                    writer.save(position(epoch, n + 1, epoch_shuffle_state))
+            start_batch = 0
+            if prefetcher is not None:
+                print(f"Epoch {epoch}: data wait {prefetcher.data_wait_fraction:.1%} of loop time so far")
+        if monitor is not None:
+            monitor.flush(num_epochs - 1, steps)
+        if writer is not None:
+            writer.save(position(max(num_epochs, first_epoch), 0, shuffle.get_state()))
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+        if writer is not None:
+            writer.close()
+    return generator, discriminator
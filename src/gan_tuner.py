@@ -0,0 +1,146 @@
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+import torch
+from exercise4_gan import Discriminator, Generator
+from .gan_step import GANStep
+from .mnist import TensorMNIST
+from .prefetch import BatchPrefetcher
+
+DEFAULT_CACHE = Path.home() / ".cache" / "cvds" / "gan_tuning.json"
+
+
+class TunedConfig(NamedTuple):
+    num_threads: int
+    interop_threads: int
+    num_workers: int
+    batch_size: int
+    images_per_sec: float
+
+
+def host_fingerprint() -> str:
+    """Short hash of the CPU model, core count, OS and torch build.
+
+    Tuned settings are only reused on a machine with the same fingerprint.
+    """
+    model = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as f:
+            model = next((line.split(":", 1)[1].strip() for line in f if line.startswith("model name")), model)
+    except OSError:
+        pass
+    parts = [model, platform.machine(), platform.system(), str(os.cpu_count()), torch.__version__]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:16]
+
+
+def default_grid() -> Dict[str, List[int]]:
+    cores = os.cpu_count() or 1
+    return {
+        "num_threads": sorted({1, max(1, cores // 2), cores}),
+        "interop_threads": sorted({1, 2}),
+        "num_workers": [0, 1, 2],
+        "batch_size": [32, 64, 128, 256],
+    }
+
+
+def _run_trials(interop_threads: int, trials: Sequence[Tuple[int, int, int]], steps: int, warmup: int) -> List[float]:
+    """Images/sec of each (num_threads, num_workers, batch_size) trial.
+
+    Runs in a fresh process because the interop pool can only be sized
+    before torch does any parallel work.
+    """
+    torch.set_num_interop_threads(interop_threads)
+    rates = []
+    for num_threads, num_workers, batch_size in trials:
+        torch.set_num_threads(num_threads)
+        torch.manual_seed(0)
+        dataset = TensorMNIST.synthetic(batch_size * (steps + warmup))
+        step = GANStep(Generator(), Discriminator())
+        prefetcher = BatchPrefetcher(dataset, batch_size, num_workers) if num_workers else None
+        batches = iter(prefetcher if prefetcher is not None else dataset.batches(batch_size))
+        try:
+            for _ in range(warmup):
+                step(next(batches)[0])
+            start = time.perf_counter()
+            for real_samples, _ in batches:
+                step(real_samples)
+            rates.append(batch_size * steps / (time.perf_counter() - start))
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
+    return rates
+
+
+def _read_cache(path: Path) -> Dict[str, Dict]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_tuned(cache: Union[str, Path] = DEFAULT_CACHE) -> Optional[TunedConfig]:
+    """Tuned settings stored for this host, or ``None``."""
+    entry = _read_cache(Path(cache)).get(host_fingerprint())
+    return TunedConfig(**entry) if entry else None
+
+
+def tune(
+    grid: Optional[Dict[str, Iterable[int]]] = None,
+    steps: int = 20,
+    warmup: int = 3,
+    cache: Union[str, Path] = DEFAULT_CACHE,
+    verbose: bool = True,
+) -> TunedConfig:
+    """Time short GAN training trials over ``grid`` and keep the fastest.
+
+    ``grid`` maps ``num_threads``, ``interop_threads``, ``num_workers`` and
+    ``batch_size`` to candidate values (see ``default_grid``); every trial
+    runs ``warmup`` + ``steps`` fused steps on synthetic MNIST-shaped data.
+    One fresh process is used per interop setting. The winner is stored in
+    ``cache`` under ``host_fingerprint()`` for ``load_tuned``. Note that
+    ``batch_size`` also changes the optimization, not just the speed;
+    restrict the grid to one value to tune threads only.
+    """
+    grid = {**default_grid(), **(grid or {})}
+    trials = list(itertools.product(grid["num_threads"], grid["num_workers"], grid["batch_size"]))
+    context = multiprocessing.get_context("spawn")
+    best: Optional[TunedConfig] = None
+    for interop_threads in grid["interop_threads"]:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            rates = pool.submit(_run_trials, interop_threads, trials, steps, warmup).result()
+        for (num_threads, num_workers, batch_size), rate in zip(trials, rates):
+            if verbose:
+                print(f"  threads={num_threads:<3} interop={interop_threads:<2} workers={num_workers} "
+                      f"batch={batch_size:<4} {rate:9.0f} img/s")
+            if best is None or rate > best.images_per_sec:
+                best = TunedConfig(num_threads, interop_threads, num_workers, batch_size, rate)
+    if best is None:
+        raise ValueError("The tuning grid is empty.")
+
+    cache = Path(cache)
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    entries = _read_cache(cache)
+    entries[host_fingerprint()] = best._asdict()
+    tmp_path = cache.with_name(cache.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(entries, f, indent=2)
+    os.replace(tmp_path, cache)
+    return best
+
+
+def apply_tuned(config: TunedConfig) -> None:
+    """Set torch's thread pools to ``config`` (interop only if still possible)."""
+    torch.set_num_threads(config.num_threads)
+    try:
+        torch.set_num_interop_threads(config.interop_threads)
+    except RuntimeError:
+        # the interop pool is fixed once torch has run parallel work
+        pass
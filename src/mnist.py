@@ -0,0 +1,150 @@
+import gzip
+import os
+import struct
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+import numpy as np
+import torch
+from torch.utils.data import Dataset
+
+# IDX type codes -> big-endian NumPy dtypes
+_IDX_DTYPES = {
+    0x08: np.dtype(np.uint8),
+    0x09: np.dtype(np.int8),
+    0x0B: np.dtype(">i2"),
+    0x0C: np.dtype(">i4"),
+    0x0D: np.dtype(">f4"),
+    0x0E: np.dtype(">f8"),
+}
+_FILES = {
+    True: ("train-images-idx3-ubyte", "train-labels-idx1-ubyte"),
+    False: ("t10k-images-idx3-ubyte", "t10k-labels-idx1-ubyte"),
+}
+
+
+def read_idx(path: Union[str, Path]) -> np.ndarray:
+    """Decode an IDX file (optionally ``.gz``) into a NumPy array in one read."""
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as f:
+        data = f.read()
+    if len(data) < 4 or data[0] != 0 or data[1] != 0 or data[2] not in _IDX_DTYPES:
+        raise ValueError(f"{path} is not an IDX file.")
+    ndim = data[3]
+    shape = struct.unpack_from(f">{ndim}I", data, 4)
+    dtype = _IDX_DTYPES[data[2]]
+    array = np.frombuffer(data, dtype=dtype, offset=4 + 4 * ndim, count=int(np.prod(shape)))
+    return array.reshape(shape).astype(dtype.newbyteorder("="), copy=False)
+
+
+def _normalize(images: torch.Tensor) -> torch.Tensor:
+    if images.dtype == torch.uint8:
+        return images.float().div_(127.5).sub_(1)
+    return images
+
+
+def _find_idx(root: Path, name: str) -> Path:
+    # torchvision keeps the files under <root>/MNIST/raw
+    for folder in (root, root / "MNIST" / "raw"):
+        for candidate in (folder / name, folder / f"{name}.gz"):
+            if candidate.exists():
+                return candidate
+    raise FileNotFoundError(
+        f"{name} not found under {root}; download MNIST once or use TensorMNIST.synthetic()."
+    )
+
+
+class TensorMNIST(Dataset):
+    """MNIST held as one ``(N, 1, 28, 28)`` image tensor plus a label tensor.
+
+    uint8 images (4x smaller) are normalized on the way out, ``x / 127.5 - 1``,
+    which equals ``ToTensor()`` followed by ``Normalize((0.5,), (0.5,))``, so
+    batches match the torchvision pipeline of ``train_gan_fixed`` without any
+    PIL conversion; ``normalized()`` does this once for the whole set.
+    ``batches`` serves whole shuffled batches by slicing with a ``randperm``;
+    indexing still works for use with a ``DataLoader``.
+    """
+
+    def __init__(self, images: torch.Tensor, labels: torch.Tensor):
+        if images.dtype not in (torch.uint8, torch.float32) or images.dim() not in (3, 4):
+            raise ValueError("images must be uint8 or float32 of shape (N, 28, 28) or (N, 1, 28, 28).")
+        if images.dim() == 3:
+            images = images.unsqueeze(1)
+        if labels.shape != (len(images),):
+            raise ValueError("labels must have one entry per image.")
+        self.images = images
+        self.labels = labels
+
+    @classmethod
+    def from_idx(
+        cls, root: Union[str, Path] = ".", train: bool = True, cache: Optional[Union[str, Path]] = None
+    ) -> "TensorMNIST":
+        """Decode local IDX files (plain or ``.gz``) under ``root``; never downloads.
+
+        With ``cache`` the decoded images are kept in a ``.npy`` file next to
+        it, named per split (``mnist.npy`` becomes ``mnist-train.npy`` or
+        ``mnist-test.npy``), and later calls memory-map it copy-on-write
+        instead of decoding again. A cached file whose shape does not match
+        the labels is decoded again.
+        """
+        root = Path(root)
+        image_file, label_file = (_find_idx(root, name) for name in _FILES[train])
+        labels = torch.from_numpy(read_idx(label_file).astype(np.int64))
+        if cache is None:
+            return cls(torch.from_numpy(read_idx(image_file).copy()), labels)
+        cache = Path(cache)
+        cache = cache.with_name(f"{cache.stem}-{'train' if train else 'test'}{cache.suffix or '.npy'}")
+        images = np.load(cache, mmap_mode="c") if cache.exists() else None
+        if images is None or images.shape != (len(labels), 28, 28):
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache.with_name(cache.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, read_idx(image_file))
+            del images  # release the stale mapping before replacing the file
+            os.replace(tmp_path, cache)
+            images = np.load(cache, mmap_mode="c")
+        return cls(torch.from_numpy(images), labels)
+
+    @classmethod
+    def synthetic(cls, n: int = 60_000, seed: int = 0) -> "TensorMNIST":
+        """Deterministic MNIST-shaped stand-in: dark background, bright center blob."""
+        generator = torch.Generator().manual_seed(seed)
+        images = torch.randint(0, 256, (n, 1, 28, 28), dtype=torch.uint8, generator=generator)
+        yy, xx = torch.meshgrid(torch.arange(28), torch.arange(28), indexing="ij")
+        blob = ((yy - 13.5) ** 2 + (xx - 13.5) ** 2) < 81
+        images.mul_(blob)
+        labels = torch.randint(0, 10, (n,), generator=generator)
+        return cls(images, labels)
+
+    def normalized(self) -> "TensorMNIST":
+        """Float32 copy with the normalization applied up front."""
+        return TensorMNIST(_normalize(self.images), self.labels)
+
+    def __len__(self) -> int:
+        return len(self.images)
+
+    def __getitem__(self, index: int) -> Tuple[torch.Tensor, int]:
+        return _normalize(self.images[index]), int(self.labels[index])
+
+    def batch(self, index: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Normalized float32 images and labels for an index tensor."""
+        return _normalize(self.images[index]), self.labels[index]
+
+    def batches(
+        self,
+        batch_size: int,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        generator: Optional[torch.Generator] = None,
+        start_batch: int = 0,
+    ) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        """One epoch of ``(images, labels)`` batches; the last one may be smaller.
+
+        ``start_batch`` skips the first batches of the epoch without
+        gathering them (the permutation is still drawn in full).
+        """
+        n = len(self)
+        order = torch.randperm(n, generator=generator) if shuffle else torch.arange(n)
+        stop = n - n % batch_size if drop_last else n
+        for start in range(start_batch * batch_size, stop, batch_size):
+            yield self.batch(order[start : start + batch_size])
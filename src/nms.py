@@ -0,0 +1,126 @@
+from typing import Iterator, Optional, Tuple
+import numpy as np
+
+
+def _corners(boxes: np.ndarray) -> np.ndarray:
+    boxes = np.asarray(boxes)
+    if boxes.ndim != 2 or boxes.shape[1] < 4:
+        raise ValueError("boxes must have shape (N, C) with C >= 4.")
+    return boxes[:, :4].astype(np.float64, copy=False)
+
+
+def _area(corners: np.ndarray) -> np.ndarray:
+    return np.clip(corners[:, 2] - corners[:, 0], 0, None) * np.clip(corners[:, 3] - corners[:, 1], 0, None)
+
+
+def _iou(a: np.ndarray, area_a: np.ndarray, b: np.ndarray, area_b: np.ndarray) -> np.ndarray:
+    lt = np.maximum(a[:, None, :2], b[None, :, :2])
+    rb = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    wh = np.clip(rb - lt, 0, None)
+    inter = wh[..., 0] * wh[..., 1]
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+
+def iter_box_iou(
+    a: np.ndarray, b: Optional[np.ndarray] = None, tile_rows: int = 1024
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield ``(row_start, iou_tile)`` for ``tile_rows`` rows of ``a`` at a time.
+
+    Peak memory is O(tile_rows * len(b)), independent of ``len(a)``.
+    """
+    a = _corners(a)
+    b = a if b is None else _corners(b)
+    area_a, area_b = _area(a), _area(b)
+    for start in range(0, len(a), tile_rows):
+        stop = start + tile_rows
+        yield start, _iou(a[start:stop], area_a[start:stop], b, area_b)
+
+
+def box_iou(
+    a: np.ndarray, b: Optional[np.ndarray] = None, tile_rows: Optional[int] = None
+) -> np.ndarray:
+    """Pairwise IoU matrix of shape ``(len(a), len(b))`` for xyxy boxes.
+
+    Only the first four columns are used, so ``(N, 5)`` coords arrays can be
+    passed directly; IoU is unchanged by ``swap``, so yxyx input works too.
+    With ``tile_rows`` the intermediates are bounded by ``tile_rows * len(b)``
+    instead of growing with ``len(a) * len(b)``.
+    """
+    if tile_rows is None:
+        a = _corners(a)
+        b = a if b is None else _corners(b)
+        return _iou(a, _area(a), b, _area(b))
+    n_b = len(a if b is None else b)
+    result = np.empty((len(a), n_b))
+    for start, tile in iter_box_iou(a, b, tile_rows):
+        result[start : start + len(tile)] = tile
+    return result
+
+
+def _greedy_nms(corners: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """Greedy NMS over boxes already sorted by priority; returns kept positions.
+
+    IoU > t implies ``|x1_a - x1_b| < (1 - t) / t * w_a``, so each kept box
+    only needs to be compared with the boxes in that window of a sort by x1
+    (or with every box it intersects in x when t == 0). The windows of all
+    boxes are found up front with two vectorized ``searchsorted`` calls.
+    """
+    n = len(corners)
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    areas = _area(corners)
+    by_x = np.argsort(corners[:, 0], kind="stable")
+    xs = corners[by_x, 0]
+    widths = corners[:, 2] - corners[:, 0]
+    if iou_threshold > 0:
+        reach = (1 - iou_threshold) / iou_threshold * widths
+        lo = np.searchsorted(xs, corners[:, 0] - reach, "left")
+        hi = np.searchsorted(xs, corners[:, 0] + reach, "right")
+    else:
+        lo = np.searchsorted(xs, corners[:, 0] - widths.max(), "left")
+        hi = np.searchsorted(xs, corners[:, 2], "right")
+    suppressed = np.zeros(n, dtype=bool)
+    for i, start, stop in zip(range(n), lo.tolist(), hi.tolist()):
+        if suppressed[i]:
+            continue
+        cand = by_x[start:stop]
+        cand = cand[cand > i]
+        cand = cand[~suppressed[cand]]
+        if len(cand) == 0:
+            continue
+        a, b = corners[i], corners[cand]
+        iw = np.clip(np.minimum(a[2], b[:, 2]) - np.maximum(a[0], b[:, 0]), 0, None)
+        ih = np.clip(np.minimum(a[3], b[:, 3]) - np.maximum(a[1], b[:, 1]), 0, None)
+        inter = iw * ih
+        union = areas[i] + areas[cand] - inter
+        suppressed[cand[(inter > iou_threshold * union) & (union > 0)]] = True
+    return np.flatnonzero(~suppressed)
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float = 0.5) -> np.ndarray:
+    """Class-agnostic greedy NMS; returns kept indices by descending score."""
+    corners = _corners(boxes)
+    order = np.argsort(-np.asarray(scores), kind="stable")
+    return order[_greedy_nms(corners[order], iou_threshold)]
+
+
+def batched_nms(coords: np.ndarray, scores: np.ndarray, iou_threshold: float = 0.5) -> np.ndarray:
+    """Per-class greedy NMS on ``(N, 5)`` ``[x1, y1, x2, y2, class_id]`` coords.
+
+    Each class is shifted by ``class_id * extent`` so boxes of different
+    classes can never overlap, which turns per-class NMS into one
+    class-agnostic pass. Returns kept indices sorted by descending score.
+    """
+    coords = np.asarray(coords)
+    if coords.ndim != 2 or coords.shape[1] < 5:
+        raise ValueError("coords must have shape (N, C) with C >= 5.")
+    scores = np.asarray(scores)
+    if len(coords) == 0:
+        return np.empty(0, dtype=np.intp)
+    corners = _corners(coords)
+    classes = coords[:, 4].astype(np.float64)
+    extent = corners.max() - corners.min() + 1
+    shifted = corners + (classes * extent)[:, None]
+    order = np.argsort(-scores, kind="stable")
+    return order[_greedy_nms(shifted[order], iou_threshold)]
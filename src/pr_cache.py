@@ -0,0 +1,124 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import numpy as np
+from .pr_curve import load_precision_recall
+
+_HASH_BLOCK = 1 << 20
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=10).hexdigest()
+
+
+def _content_hash(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class PRCache:
+    """Binary cache in front of ``load_precision_recall``.
+
+    Each parsed CSV is stored in ``cache_dir`` as one ``(2, N)`` float64
+    ``.npy`` file named ``<path key>-<state key>.npy``. The path key is the
+    resolved path; the state key is its size and mtime, plus a content hash
+    when ``hash_content`` is set (this re-reads the file on every lookup but
+    survives touched or copied files). Hits are memory-mapped read-only.
+
+    With ``max_bytes`` the cache evicts least recently used entries after
+    each store; hits refresh an entry's mtime, which is its LRU clock.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        hash_content: bool = False,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hash_content = hash_content
+
+    def _path_key(self, csv_file: Union[str, Path]) -> str:
+        return _digest(str(Path(csv_file).resolve()))
+
+    def entry(self, csv_file: Union[str, Path]) -> Path:
+        """Cache file that holds the current version of ``csv_file``."""
+        csv_file = Path(csv_file)
+        stat = csv_file.stat()
+        state = [str(stat.st_size), str(stat.st_mtime_ns)]
+        if self.hash_content:
+            state.append(_content_hash(csv_file))
+        return self.cache_dir / f"{self._path_key(csv_file)}-{_digest(*state)}.npy"
+
+    def load(self, csv_file: Union[str, Path]) -> Tuple[np.ndarray, np.ndarray]:
+        """Same result as ``load_precision_recall``, parsed at most once per version.
+
+        The returned arrays are read-only memory maps on a hit and plain
+        arrays right after parsing.
+        """
+        if not Path(csv_file).exists():
+            raise FileNotFoundError(csv_file)
+        entry = self.entry(csv_file)
+        try:
+            table = np.load(entry, mmap_mode="r")
+        except (FileNotFoundError, ValueError):
+            # a missing or unreadable entry is simply a miss
+            pass
+        else:
+            os.utime(entry)
+            return table[0], table[1]
+        precision, recall = load_precision_recall(str(csv_file))
+        self._store(entry, np.stack([precision, recall]))
+        return precision, recall
+
+    def _store(self, entry: Path, table: np.ndarray) -> None:
+        self._remove(f"{entry.name.split('-')[0]}-*.npy")
+        tmp_path = entry.with_name(entry.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, table)
+        os.replace(tmp_path, entry)
+        if self.max_bytes is not None:
+            self.evict(self.max_bytes)
+
+    def _remove(self, pattern: str) -> int:
+        removed = 0
+        for path in self.cache_dir.glob(pattern):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def invalidate(self, csv_file: Optional[Union[str, Path]] = None) -> int:
+        """Drop the entries of ``csv_file`` (every entry if ``None``); returns the count."""
+        if csv_file is None:
+            return self._remove("*.npy")
+        return self._remove(f"{self._path_key(csv_file)}-*.npy")
+
+    def evict(self, max_bytes: int) -> int:
+        """Remove least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        for path in self.cache_dir.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    @property
+    def nbytes(self) -> int:
+        return sum(path.stat().st_size for path in self.cache_dir.glob("*.npy"))
@@ -1,23 +1,376 @@
 import csv
+import io
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Tuple
-import matplotlib.pyplot as plt
+from typing import Iterable, Iterator, List, Optional, Tuple
 import numpy as np
 
-def load_precision_recall(csv_file: str) -> Tuple[np.ndarray, np.ndarray]:
-    precision, recall = [], []
-    csv_path = Path(csv_file)
-    if not csv_path.exists():
+_CHUNK_BYTES = 1 << 24
+_COLUMNS = ("precision", "recall")
+
+
+def _parse_rows(data: bytes, usecols: Tuple[int, int]) -> np.ndarray:
+    if not data.strip():
+        return np.empty((0, 2))
+    return np.loadtxt(
+        io.BytesIO(data), delimiter=",", quotechar='"', usecols=usecols, ndmin=2, dtype=np.float64,
+        comments=None,  # "#" is data, as for csv.DictReader
+    )
+
+
+def _iter_tables(csv_file: str, chunk_bytes: int) -> Iterator[np.ndarray]:
+    """Yield ``(rows, 2)`` float64 blocks of [precision, recall] values.
+
+    The file is read in ``chunk_bytes`` blocks cut at line boundaries and
+    each block is parsed in C by ``np.loadtxt``. Column lookup follows
+    ``csv.DictReader``: names come from the first line, the last duplicate
+    wins, and a missing column raises ``KeyError`` only if there is data.
+    """
+    if not Path(csv_file).exists():
+        raise FileNotFoundError(csv_file)
+    with open(csv_file, "rb") as f:
+        header = next(csv.reader([f.readline().decode()]), [])
+        usecols = tuple(
+            max((i for i, name in enumerate(header) if name == column), default=-1)
+            for column in _COLUMNS
+        )
+        tail = b""
+        while True:
+            block = f.read(chunk_bytes)
+            data = tail + block
+            if block:
+                cut = data.rfind(b"\n") + 1
+                data, tail = data[:cut], data[cut:]
+            if data.strip():
+                for column, index in zip(_COLUMNS, usecols):
+                    if index < 0:
+                        raise KeyError(column)
+                yield _parse_rows(data, usecols)
+            if not block:
+                return
+
+
+def _count_lines(csv_file: str, chunk_bytes: int) -> int:
+    lines = 1
+    with open(csv_file, "rb") as f:
+        for block in iter(lambda: f.read(chunk_bytes), b""):
+            lines += block.count(b"\n")
+    return lines
+
+
+def iter_precision_recall(
+    csv_file: str, chunk_bytes: int = _CHUNK_BYTES
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Stream ``(precision, recall)`` array chunks of a large CSV file."""
+    for table in _iter_tables(csv_file, chunk_bytes):
+        yield table[:, 0].copy(), table[:, 1].copy()
+
+
+def load_precision_recall(csv_file: str, chunk_bytes: int = _CHUNK_BYTES) -> Tuple[np.ndarray, np.ndarray]:
+    if not Path(csv_file).exists():
         raise FileNotFoundError(csv_file)
-    with open(csv_file, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            precision.append(float(row["precision"]))
-            recall.append(float(row["recall"]))
-    return np.array(precision), np.array(recall)
-
-def plot_data(csv_file: str) -> None:
+    tables = _iter_tables(csv_file, chunk_bytes)
+    # an upper bound on the row count, so parsed chunks go straight into place
+    capacity = _count_lines(csv_file, chunk_bytes)
+    precision, recall = np.empty(capacity), np.empty(capacity)
+    rows = 0
+    for table in tables:
+        precision[rows : rows + len(table)] = table[:, 0]
+        recall[rows : rows + len(table)] = table[:, 1]
+        rows += len(table)
+    return precision[:rows], recall[:rows]
+
+
+def _curve_from_counts(positives: np.ndarray, negatives: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Precision/recall from per-threshold counts ordered by falling score."""
+    tp = np.cumsum(positives)
+    fp = np.cumsum(negatives)
+    if len(tp) == 0 or tp[-1] == 0:
+        raise ValueError("At least one positive label is required for a PR curve.")
+    return tp / (tp + fp), tp / tp[-1]
+
+
+def precision_recall_from_scores(scores: np.ndarray, labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Exact PR curve from raw scores and binary labels.
+
+    One sort by descending score and a cumulative sum give the counts at
+    every distinct threshold; the result can be written with
+    ``save_precision_recall`` and plotted with ``plot_data``.
+    """
+    scores = np.asarray(scores, dtype=np.float64).ravel()
+    labels = np.asarray(labels).ravel().astype(bool)
+    if scores.shape != labels.shape:
+        raise ValueError("scores and labels must have the same length.")
+    order = np.argsort(-scores, kind="stable")
+    scores, labels = scores[order], labels[order]
+    if len(scores) == 0:
+        raise ValueError("At least one positive label is required for a PR curve.")
+    # close a threshold group wherever the next score differs
+    ends = np.append(np.flatnonzero(np.diff(scores)), len(scores) - 1)
+    tp = np.cumsum(labels)[ends]
+    fp = ends + 1 - tp
+    return _curve_from_counts(np.diff(tp, prepend=0), np.diff(fp, prepend=0))
+
+
+class ScoreHistogram:
+    """Fixed-bin score histograms of positives and negatives.
+
+    Memory is O(bins) however many predictions are added, and histograms
+    built on different shards or processes (they pickle as two arrays) can
+    be combined with ``merge`` or ``+``. ``curve`` returns the PR curve at
+    the bin edges; scores outside ``score_range`` fall into the end bins.
+    """
+
+    def __init__(self, bins: int = 10_000, score_range: Tuple[float, float] = (0.0, 1.0)):
+        self.bins = bins
+        self.score_range = (float(score_range[0]), float(score_range[1]))
+        self.positives = np.zeros(bins, dtype=np.int64)
+        self.negatives = np.zeros(bins, dtype=np.int64)
+
+    def update(self, scores: np.ndarray, labels: np.ndarray) -> "ScoreHistogram":
+        scores = np.asarray(scores, dtype=np.float64).ravel()
+        labels = np.asarray(labels).ravel().astype(bool)
+        if scores.shape != labels.shape:
+            raise ValueError("scores and labels must have the same length.")
+        low, high = self.score_range
+        index = np.clip(((scores - low) * (self.bins / (high - low))).astype(np.int64), 0, self.bins - 1)
+        self.positives += np.bincount(index[labels], minlength=self.bins)
+        self.negatives += np.bincount(index[~labels], minlength=self.bins)
+        return self
+
+    def merge(self, other: "ScoreHistogram") -> "ScoreHistogram":
+        if other.bins != self.bins or other.score_range != self.score_range:
+            raise ValueError("Only histograms with the same bins and score_range can be merged.")
+        self.positives += other.positives
+        self.negatives += other.negatives
+        return self
+
+    def __add__(self, other: "ScoreHistogram") -> "ScoreHistogram":
+        merged = ScoreHistogram(self.bins, self.score_range)
+        return merged.merge(self).merge(other)
+
+    @property
+    def count(self) -> int:
+        return int(self.positives.sum() + self.negatives.sum())
+
+    def curve(self) -> Tuple[np.ndarray, np.ndarray]:
+        occupied = (self.positives + self.negatives)[::-1] > 0
+        return _curve_from_counts(self.positives[::-1][occupied], self.negatives[::-1][occupied])
+
+
+def merge_histograms(histograms: Iterable[ScoreHistogram]) -> ScoreHistogram:
+    histograms = iter(histograms)
+    first = next(histograms)
+    merged = ScoreHistogram(first.bins, first.score_range).merge(first)
+    for histogram in histograms:
+        merged.merge(histogram)
+    return merged
+
+
+def save_precision_recall(csv_file: str, precision: np.ndarray, recall: np.ndarray) -> None:
+    """Write a ``precision,recall`` CSV that ``plot_data`` can read."""
+    with open(csv_file, "w") as f:
+        f.write("precision,recall\n")
+        np.savetxt(f, np.column_stack([precision, recall]), delimiter=",", fmt="%.17g")
+
+
+class PRCurve:
+    """Precision/recall points indexed for batched operating-point queries.
+
+    The points are sorted by recall once and the precision envelope (best
+    precision at recall >= r) is precomputed, so every query is one
+    vectorized ``searchsorted``: O(log n) per target instead of a scan.
+    Queries accept scalars or arrays and return ``nan`` where no point
+    qualifies. Points with a non-finite precision or recall are ignored.
+    ``interpolate=True`` reads the envelope as piecewise linear between
+    points instead of as a step function.
+    """
+
+    def __init__(self, precision: np.ndarray, recall: np.ndarray):
+        precision = np.asarray(precision, dtype=np.float64).ravel()
+        recall = np.asarray(recall, dtype=np.float64).ravel()
+        if precision.shape != recall.shape or len(precision) == 0:
+            raise ValueError("precision and recall must be non-empty and of the same length.")
+        self.precision, self.recall = precision, recall
+        # NaN precision (e.g. at zero predictions) would poison the envelope
+        finite = np.flatnonzero(np.isfinite(precision) & np.isfinite(recall))
+        if len(finite) == 0:
+            raise ValueError("precision and recall have no finite points.")
+        order = finite[np.argsort(recall[finite], kind="stable")]
+        self._recall = recall[order]
+        sorted_precision = precision[order]
+        self._envelope = np.maximum.accumulate(sorted_precision[::-1])[::-1]
+        # original index of the point that attains the envelope at each position
+        positions = np.arange(len(order))
+        record = np.where(sorted_precision == self._envelope, positions, len(order))
+        self._best = order[np.minimum.accumulate(record[::-1])[::-1]]
+        # np.interp needs distinct x; the first of tied recalls has the best envelope
+        self._knots, first = np.unique(self._recall, return_index=True)
+        self._knot_envelope = self._envelope[first]
+
+    @classmethod
+    def from_csv(cls, csv_file: str) -> "PRCurve":
+        return cls(*load_precision_recall(csv_file))
+
+    def __len__(self) -> int:
+        return len(self._recall)
+
+    def index_at_recall(self, min_recall) -> np.ndarray:
+        """Index of the highest-precision point with recall >= ``min_recall`` (-1 if none)."""
+        pos = np.searchsorted(self._recall, min_recall, "left")
+        found = pos < len(self)
+        return np.where(found, self._best[np.minimum(pos, len(self) - 1)], -1)
+
+    def precision_at_recall(self, min_recall, interpolate: bool = False) -> np.ndarray:
+        """Best precision among points with recall >= ``min_recall``."""
+        min_recall = np.asarray(min_recall, dtype=np.float64)
+        if interpolate:
+            # left of the first knot every point qualifies; right of the last none does
+            return np.interp(min_recall, self._knots, self._knot_envelope, right=np.nan)
+        pos = np.searchsorted(self._recall, min_recall, "left")
+        return np.where(pos < len(self), self._envelope[np.minimum(pos, len(self) - 1)], np.nan)
+
+    def recall_at_precision(self, min_precision, interpolate: bool = False) -> np.ndarray:
+        """Highest recall whose best precision is still >= ``min_precision``."""
+        min_precision = np.asarray(min_precision, dtype=np.float64)
+        # the envelope falls with recall, so its negation is sorted
+        count = np.searchsorted(-self._envelope, -min_precision, "right")
+        last = np.maximum(count - 1, 0)
+        result = self._recall[last]
+        if interpolate:
+            after = np.minimum(count, len(self) - 1)
+            drop = self._envelope[last] - self._envelope[after]
+            step = np.divide(
+                self._envelope[last] - min_precision, drop, out=np.zeros_like(result), where=drop > 0
+            )
+            result = result + np.clip(step, 0, 1) * (self._recall[after] - result)
+        return np.where(count > 0, result, np.nan)
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of ``max_points`` points.
+
+    The end points are kept and every bucket in between contributes the
+    point spanning the largest triangle with the previous pick and the mean
+    of the next bucket, which keeps peaks and corners of the curve.
+    """
+    n = len(x)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    counts = np.diff(edges)
+    # mean of every bucket, plus the last point as the "next bucket" of the last one
+    mean_x = np.append(np.add.reduceat(x[1:-1], edges[:-1] - 1) / counts, x[-1])
+    mean_y = np.append(np.add.reduceat(y[1:-1], edges[:-1] - 1) / counts, y[-1])
+    keep = np.empty(max_points, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for bucket, (start, stop) in enumerate(zip(edges[:-1].tolist(), edges[1:].tolist())):
+        bx, by = x[start:stop], y[start:stop]
+        ax, ay = x[prev], y[prev]
+        area = np.abs((ax - mean_x[bucket + 1]) * (by - ay) - (ax - bx) * (mean_y[bucket + 1] - ay))
+        prev = start + int(np.argmax(area))
+        keep[bucket + 1] = prev
+    return keep
+
+
+def _minmax(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """End points plus the lowest and highest ``y`` of ``(max_points - 2) // 2`` buckets."""
+    if max_points < 4:
+        # no room for a min/max pair; LTTB keeps the single most prominent point
+        return _lttb(x, y, max_points)
+    n = len(y)
+    bucket = np.arange(n) * ((max_points - 2) // 2) // n
+    by_value = np.lexsort((y, bucket))
+    ends = np.flatnonzero(np.diff(bucket[by_value], append=bucket[-1] + 1))
+    starts = np.append(0, ends[:-1] + 1)
+    return np.unique(np.concatenate([[0, n - 1], by_value[starts], by_value[ends]]))
+
+
+_DECIMATORS = {"lttb": _lttb, "minmax": _minmax}
+
+
+def decimate(
+    x: np.ndarray, y: np.ndarray, max_points: int = 2000, method: str = "lttb"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Downsample a curve to at most ``max_points`` shape-preserving points.
+
+    ``method`` is ``"lttb"`` (Largest-Triangle-Three-Buckets) or
+    ``"minmax"`` (extremes of ``y`` per bucket). Points stay in curve order;
+    curves that are already short enough are returned unchanged.
+    """
+    if method not in _DECIMATORS:
+        raise ValueError(f"method must be one of {tuple(_DECIMATORS)}, got {method!r}.")
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    if len(x) <= max_points or max_points < 3:
+        return x, y
+    keep = _DECIMATORS[method](x, y, max_points)
+    return x[keep], y[keep]
+
+
+def render_curve(
+    csv_file: str, output: str, max_points: Optional[int] = 2000, method: str = "lttb", dpi: int = 100
+) -> str:
+    """Render the PR curve of ``csv_file`` to a PNG/SVG/PDF file, headless.
+
+    Uses a bare Agg ``Figure`` (no pyplot state, no display), so it is safe
+    in worker processes and CI jobs. At most ``max_points`` points are drawn
+    (``None`` draws every point). Returns ``output``.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    precision, recall = load_precision_recall(csv_file)
+    if max_points is not None:
+        precision, recall = decimate(precision, recall, max_points, method)
+    fig = Figure(figsize=(6, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(precision, recall, marker="o", markersize=3)
+    ax.set_xlim(-0.05, 1.05)
+    ax.set_ylim(-0.05, 1.05)
+    ax.set_xlabel("Precision")
+    ax.set_ylabel("Recall")
+    ax.set_title("Precision–Recall Curve")
+    ax.grid(True)
+    fig.savefig(output, dpi=dpi)
+    return output
+
+
+def _render_job(job: Tuple[str, str], **options) -> str:
+    return render_curve(*job, **options)
+
+
+def render_curves(
+    jobs: Iterable[Tuple[str, str]], workers: Optional[int] = None, **options
+) -> List[str]:
+    """Render many ``(csv_file, output)`` pairs on a process pool.
+
+    ``options`` are passed to ``render_curve``; with ``workers=1`` the jobs
+    run in this process. Returns the output paths in job order.
+    """
+    jobs = list(jobs)
+    render = partial(_render_job, **options)
+    if workers == 1 or len(jobs) <= 1:
+        return [render(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render, jobs))
+
+
+def plot_data(csv_file: str, output: Optional[str] = None, max_points: Optional[int] = None) -> None:
+    """Plot the PR curve of ``csv_file``.
+
+    Without ``output`` the curve is shown interactively as before; with it
+    the figure is written to that file by ``render_curve`` instead, drawing
+    at most ``max_points`` points (2000 by default in that mode).
+    """
+    if output is not None:
+        render_curve(csv_file, output, max_points=max_points or 2000)
+        return
+    import matplotlib.pyplot as plt
+
     precision, recall = load_precision_recall(csv_file)
+    if max_points is not None:
+        precision, recall = decimate(precision, recall, max_points)
     plt.figure(figsize=(6, 6))
     plt.plot(precision, recall, marker="o")
     plt.xlim(-0.05, 1.05)
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+import numpy as np
+
+
+class APResult(NamedTuple):
+    average_precision: np.ndarray
+    interpolated_ap: np.ndarray
+    pr_auc: np.ndarray
+
+
+def _metrics(scores: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """``(3, B)`` AP, interpolated AP and PR-AUC for ``(B, N)`` class rows.
+
+    Rows are contiguous, so the sort, cumulative sums and accumulations all
+    run along the fast axis. Tied scores are evaluated at the end of their
+    tie group; when a block has no ties the gathers are skipped.
+    """
+    n_rows, n = scores.shape
+    # every quantity is read at tie-group ends, so the order inside a tie
+    # group is irrelevant and the (much faster) unstable sort is enough
+    order = np.argsort(-scores, axis=1)
+    ranked = np.take_along_axis(scores, order, axis=1)
+    hits = np.take_along_axis(labels, order, axis=1).astype(np.float64)
+    tp = np.cumsum(hits, axis=1)
+    positives = tp[:, -1].copy()
+    precision = tp / np.arange(1, n + 1)
+
+    # Each positive adds 1 / positives of recall at the end of its tie
+    # group, so every metric is a hit-weighted row sum: AP of the precision
+    # there, interpolated AP of the envelope, and each PR-AUC trapezoid of
+    # the mean of that precision and the one at the previous group end.
+    group_end = np.ones((n_rows, n), dtype=bool)
+    np.not_equal(ranked[:, 1:], ranked[:, :-1], out=group_end[:, :-1])
+    if group_end.all():
+        p_end = precision
+        envelope = np.maximum.accumulate(precision[:, ::-1], axis=1)[:, ::-1]
+        p_prev_sum = hits[:, 0] + np.einsum("ij,ij->i", hits[:, 1:], precision[:, :-1])
+    else:
+        positions = np.broadcast_to(np.arange(n), (n_rows, n))
+        end = np.minimum.accumulate(np.where(group_end, positions, n)[:, ::-1], axis=1)[:, ::-1]
+        p_end = np.take_along_axis(precision, end, axis=1)
+        envelope = np.maximum.accumulate(np.where(group_end, precision, 0)[:, ::-1], axis=1)[:, ::-1]
+        envelope = np.take_along_axis(envelope, end, axis=1)
+        # last end strictly before each position; -1 means the (0, 1) start
+        prev = np.maximum.accumulate(np.where(group_end, positions, -1), axis=1)[:, :-1]
+        p_prev = np.ones((n_rows, n))
+        p_prev[:, 1:] = np.where(prev >= 0, np.take_along_axis(precision, np.maximum(prev, 0), axis=1), 1.0)
+        p_prev_sum = np.einsum("ij,ij->i", hits, p_prev)
+    p_end_sum = np.einsum("ij,ij->i", hits, p_end)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ap = p_end_sum / positives
+        interpolated = np.einsum("ij,ij->i", hits, envelope) / positives
+        auc = (p_end_sum + p_prev_sum) / (2 * positives)
+    return np.stack([ap, interpolated, auc])
+
+
+def average_precision(
+    scores: np.ndarray,
+    labels: np.ndarray,
+    n_threads: Optional[int] = None,
+    block_columns: Optional[int] = None,
+) -> APResult:
+    """AP, all-point interpolated AP and trapezoidal PR-AUC for every class.
+
+    ``scores`` and ``labels`` are ``(N, C)``; each column is one class. The
+    columns are processed in blocks of ``block_columns`` (sized to roughly
+    4M elements by default, which bounds memory) with one vectorized
+    column-wise sort per block. ``n_threads`` runs blocks on a thread pool;
+    NumPy releases the GIL in the sort and cumulative sums. Classes without
+    positive labels get ``nan``.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    labels = np.asarray(labels).astype(bool)
+    if scores.ndim == 1:
+        scores, labels = scores[:, None], labels.reshape(-1, 1)
+    if scores.ndim != 2 or scores.shape != labels.shape:
+        raise ValueError("scores and labels must both have shape (N, C).")
+    n, n_classes = scores.shape
+    if n == 0:
+        return APResult(*np.full((3, n_classes), np.nan))
+    if block_columns is None:
+        block_columns = max(1, (1 << 22) // max(n, 1))
+    starts = range(0, n_classes, block_columns)
+
+    def block(start: int) -> np.ndarray:
+        stop = start + block_columns
+        # one contiguous row per class keeps every pass on the fast axis
+        rows = np.ascontiguousarray(scores[:, start:stop].T)
+        return _metrics(rows, np.ascontiguousarray(labels[:, start:stop].T))
+
+    if n_threads and n_threads > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            blocks = list(pool.map(block, starts))
+    else:
+        blocks = [block(start) for start in starts]
+    metrics = np.concatenate(blocks, axis=1) if blocks else np.empty((3, 0))
+    return APResult(*metrics)
@@ -0,0 +1,179 @@
+import queue
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+import torch
+from torch.utils.data import DataLoader, Dataset
+from .mnist import TensorMNIST
+
+_STOP = object()
+
+
+class LabelBuffers:
+    """Preallocated discriminator targets, one ``(2n, 1)`` tensor per batch size.
+
+    ``get(n)`` returns ``(all_labels, real_labels, fake_labels)`` where the
+    first ``n`` rows are ones and the last ``n`` zeros; the real and fake
+    labels are views, so a training loop allocates targets once per batch
+    size instead of calling ``torch.ones``/``torch.zeros`` every step.
+    """
+
+    def __init__(self, device: str = "cpu", dtype: torch.dtype = torch.float32):
+        self.device = device
+        self.dtype = dtype
+        self._buffers: Dict[int, torch.Tensor] = {}
+
+    def get(self, batch_size: int) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        labels = self._buffers.get(batch_size)
+        if labels is None:
+            labels = torch.zeros((2 * batch_size, 1), device=self.device, dtype=self.dtype)
+            labels[:batch_size] = 1
+            self._buffers[batch_size] = labels
+        return labels, labels[:batch_size], labels[batch_size:]
+
+
+class BatchPrefetcher:
+    """Persistent background producers for ``TensorMNIST`` batches.
+
+    ``num_workers`` threads live as long as the prefetcher. Every epoch the
+    main thread draws the ``randperm`` (so a seeded ``generator`` gives the
+    same order as ``TensorMNIST.batches``) and hands batch ``i`` to worker
+    ``i % num_workers``; each worker gathers, normalizes and moves its
+    batches to ``device`` ahead of time into its own queue of ``depth``
+    slots (2 = double buffering). Batches are consumed round-robin, so they
+    arrive in order. Tensor indexing releases the GIL, so threads overlap
+    with the training step.
+
+    ``data_wait_fraction`` is the share of iteration time the consumer spent
+    blocked waiting for a batch.
+    """
+
+    def __init__(
+        self,
+        dataset: TensorMNIST,
+        batch_size: int,
+        num_workers: int = 1,
+        depth: int = 2,
+        device: str = "cpu",
+        shuffle: bool = True,
+        drop_last: bool = False,
+        generator: Optional[torch.Generator] = None,
+    ):
+        if num_workers < 1 or depth < 1:
+            raise ValueError("num_workers and depth must be at least 1.")
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.device = torch.device(device)
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.generator = generator
+        self.wait_seconds = 0.0
+        self.total_seconds = 0.0
+        self._epoch = 0
+        self._tasks: List[queue.Queue] = [queue.Queue() for _ in range(num_workers)]
+        self._ready: List[queue.Queue] = [queue.Queue(maxsize=depth) for _ in range(num_workers)]
+        self._threads = [
+            threading.Thread(target=self._work, args=(tasks, ready), daemon=True)
+            for tasks, ready in zip(self._tasks, self._ready)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self, tasks: queue.Queue, ready: queue.Queue) -> None:
+        pin = self.device.type == "cuda"
+        while True:
+            task = tasks.get()
+            if task is _STOP:
+                return
+            epoch, index = task
+            if epoch != self._epoch:
+                continue  # the consumer abandoned that epoch
+            try:
+                images, labels = self.dataset.batch(index)
+                if pin:
+                    images, labels = images.pin_memory(), labels.pin_memory()
+                item = (images.to(self.device, non_blocking=pin), labels.to(self.device, non_blocking=pin))
+            except Exception as error:  # re-raised in the consumer
+                item = error
+            ready.put((epoch, item))
+
+    def __len__(self) -> int:
+        n = len(self.dataset)
+        return n // self.batch_size if self.drop_last else -(-n // self.batch_size)
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        return self.epoch()
+
+    def epoch(self, start_batch: int = 0) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        """One epoch of batches, skipping the first ``start_batch`` of them."""
+        self._epoch += 1
+        epoch = self._epoch
+        n = len(self.dataset)
+        order = torch.randperm(n, generator=self.generator) if self.shuffle else torch.arange(n)
+        n_batches = len(self)
+        for i in range(start_batch, n_batches):
+            start = i * self.batch_size
+            self._tasks[i % len(self._tasks)].put((epoch, order[start : start + self.batch_size]))
+        return self._consume(epoch, start_batch, n_batches)
+
+    def _consume(self, epoch: int, start_batch: int, n_batches: int) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        start = time.perf_counter()
+        try:
+            for i in range(start_batch, n_batches):
+                ready = self._ready[i % len(self._ready)]
+                waited = time.perf_counter()
+                item_epoch, item = ready.get()
+                while item_epoch != epoch:  # left over from an abandoned epoch
+                    item_epoch, item = ready.get()
+                self.wait_seconds += time.perf_counter() - waited
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self.total_seconds += time.perf_counter() - start
+
+    @property
+    def data_wait_fraction(self) -> float:
+        return self.wait_seconds / self.total_seconds if self.total_seconds else 0.0
+
+    def close(self) -> None:
+        self._epoch += 1  # makes every queued task stale
+        for tasks, ready in zip(self._tasks, self._ready):
+            tasks.put(_STOP)
+            # unblock a worker stuck on a full queue
+            while not ready.empty():
+                ready.get_nowait()
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self) -> "BatchPrefetcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def make_loader(
+    dataset: Dataset,
+    batch_size: int,
+    num_workers: int = 2,
+    prefetch_factor: int = 2,
+    shuffle: bool = True,
+    device: str = "cpu",
+) -> DataLoader:
+    """``DataLoader`` with persistent, prefetching worker processes.
+
+    For map-style datasets that need per-sample work (e.g. torchvision's
+    MNIST); ``TensorMNIST`` is faster with ``BatchPrefetcher``.
+    """
+    if num_workers == 0:
+        return DataLoader(dataset, batch_size=batch_size, shuffle=shuffle, pin_memory=device.startswith("cuda"))
+    return DataLoader(
+        dataset,
+        batch_size=batch_size,
+        shuffle=shuffle,
+        num_workers=num_workers,
+        prefetch_factor=prefetch_factor,
+        persistent_workers=True,
+        pin_memory=device.startswith("cuda"),
+    )
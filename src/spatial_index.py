@@ -0,0 +1,168 @@
+from typing import Any, List, Tuple
+import numpy as np
+
+_LAYOUTS = {"xyxy": [0, 1, 2, 3], "yxyx": [1, 0, 3, 2]}
+
+
+def _expand(parents: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Repeat each parent ``counts`` times next to ``starts + 0 .. counts - 1``."""
+    total = int(counts.sum())
+    within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(parents, counts), np.repeat(starts, counts) + within
+
+
+def _group_bounds(corners: np.ndarray, group: int) -> np.ndarray:
+    starts = np.arange(0, len(corners), group)
+    return np.column_stack([
+        np.minimum.reduceat(corners[:, 0], starts),
+        np.minimum.reduceat(corners[:, 1], starts),
+        np.maximum.reduceat(corners[:, 2], starts),
+        np.maximum.reduceat(corners[:, 3], starts),
+    ])
+
+
+def _as_queries(values: Any, n_cols: int, name: str) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[None, :]
+    if values.ndim != 2 or values.shape[1] != n_cols:
+        raise ValueError(f"{name} must have shape (Q, {n_cols}).")
+    return values
+
+
+class BoxIndex:
+    """Packed STR R-tree over an ``(N, 4+)`` coords array, stored in flat arrays.
+
+    Leaves are bulk-loaded with Sort-Tile-Recursive packing and every upper
+    level groups ``node_size`` consecutive nodes, so the children of node
+    ``i`` are always ``i * node_size ... (i + 1) * node_size - 1`` on the level
+    below and the tree needs no pointers. Queries traverse all levels for a
+    whole batch at once as (query, node) pair arrays.
+
+    ``layout`` describes the boxes ("xyxy" or the swapped "yxyx");
+    queries are always given as xyxy regions and (x, y) points, and results
+    are row indices into the original array.
+    """
+
+    def __init__(self, coords: np.ndarray, layout: str = "xyxy", node_size: int = 16):
+        coords = np.asarray(coords)
+        if coords.ndim != 2 or coords.shape[1] < 4 or len(coords) == 0:
+            raise ValueError("coords must have shape (N, C) with N >= 1 and C >= 4.")
+        if layout not in _LAYOUTS:
+            raise ValueError(f"layout must be one of {tuple(_LAYOUTS)}, got {layout!r}.")
+        corners = coords[:, _LAYOUTS[layout]].astype(np.float64)
+        self.node_size = node_size
+        self.layout = layout
+
+        # STR: vertical slices by center x, then runs of node_size by center y.
+        n = len(corners)
+        n_leaves = -(-n // node_size)
+        n_slices = int(np.ceil(np.sqrt(n_leaves)))
+        per_slice = -(-n_leaves // n_slices) * node_size
+        by_x = np.argsort(corners[:, 0] + corners[:, 2], kind="stable")
+        slice_of = np.empty(n, dtype=np.int64)
+        slice_of[by_x] = np.arange(n) // per_slice
+        # per_slice is a multiple of node_size, so no leaf straddles two slices
+        order = np.lexsort((corners[:, 1] + corners[:, 3], slice_of))
+        self._order = order
+        self._boxes = corners[order]
+        self._classes = coords[order, 4] if coords.shape[1] > 4 else None
+
+        levels = [self._boxes]
+        while len(levels[-1]) > 1:
+            levels.append(_group_bounds(levels[-1], node_size))
+        self._levels = levels[::-1]  # root first, boxes last
+        self._bounds = self._levels[0][0]
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def _pairs(self, regions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(query, box position) pairs whose boxes intersect the regions."""
+        q = np.arange(len(regions))
+        node = np.zeros(len(regions), dtype=np.int64)
+        for depth, level in enumerate(self._levels):
+            if depth:
+                starts = node * self.node_size
+                counts = np.minimum(starts + self.node_size, len(level)) - starts
+                q, node = _expand(q, starts, counts)
+            b, r = level[node], regions[q]
+            hit = (b[:, 0] <= r[:, 2]) & (b[:, 2] >= r[:, 0]) & (b[:, 1] <= r[:, 3]) & (b[:, 3] >= r[:, 1])
+            q, node = q[hit], node[hit]
+        return q, node
+
+    def _filter_classes(self, q: np.ndarray, pos: np.ndarray, classes: np.ndarray):
+        if self._classes is None:
+            raise ValueError("Class filtering needs a class_id column in coords.")
+        keep = self._classes[pos] == classes[q]
+        return q[keep], pos[keep]
+
+    def query(self, regions: Any, classes: Any = None, batch_size: int = 4096) -> List[np.ndarray]:
+        """Indices of boxes intersecting each xyxy region (edges inclusive).
+
+        ``classes`` is one class id or one per region. Returns a list with a
+        sorted index array per region.
+        """
+        regions = _as_queries(regions, 4, "regions")
+        if classes is not None:
+            classes = np.broadcast_to(np.asarray(classes), (len(regions),))
+        results: List[np.ndarray] = []
+        for start in range(0, len(regions), batch_size):
+            batch = regions[start : start + batch_size]
+            q, pos = self._pairs(batch)
+            if classes is not None:
+                q, pos = self._filter_classes(q, pos, classes[start : start + batch_size])
+            ids = self._order[pos]
+            order = np.lexsort((ids, q))
+            ids = ids[order]
+            splits = np.searchsorted(q[order], np.arange(1, len(batch)))
+            results.extend(np.split(ids, splits))
+        return results
+
+    def nearest(self, points: Any, k: int = 1, classes: Any = None) -> Tuple[np.ndarray, np.ndarray]:
+        """k nearest boxes to each (x, y) point by point-to-box distance.
+
+        Returns ``(indices, distances)`` of shape ``(Q, k)``, nearest first,
+        padded with ``-1`` / ``inf`` when fewer than ``k`` boxes qualify.
+        Each round queries a square window of half-size ``r`` around the
+        still-unresolved points; once ``k`` boxes lie within distance ``r``
+        the answer is exact, otherwise ``r`` doubles.
+        """
+        points = _as_queries(points, 2, "points")
+        n_q = len(points)
+        wanted = None if classes is None else np.broadcast_to(np.asarray(classes), (n_q,))
+        indices = np.full((n_q, k), -1, dtype=np.int64)
+        distances = np.full((n_q, k), np.inf)
+        x1, y1, x2, y2 = self._bounds
+        span = max(x2 - x1, y2 - y1, 1e-12)
+        radius = np.full(n_q, span * np.sqrt(k / len(self)))
+        # once a window covers the whole tree, every candidate has been seen
+        everything = np.hypot(
+            np.maximum(np.abs(points[:, 0] - x1), np.abs(points[:, 0] - x2)),
+            np.maximum(np.abs(points[:, 1] - y1), np.abs(points[:, 1] - y2)),
+        )
+        todo = np.arange(n_q)
+        while len(todo):
+            p, r = points[todo], radius[todo]
+            q, pos = self._pairs(np.column_stack([p - r[:, None], p + r[:, None]]))
+            if wanted is not None:
+                q, pos = self._filter_classes(q, pos, wanted[todo])
+            b = self._boxes[pos]
+            dx = np.maximum(np.maximum(b[:, 0] - p[q, 0], p[q, 0] - b[:, 2]), 0)
+            dy = np.maximum(np.maximum(b[:, 1] - p[q, 1], p[q, 1] - b[:, 3]), 0)
+            dist = np.hypot(dx, dy)
+            within = np.bincount(q[dist <= r[q]], minlength=len(todo))
+            done = (within >= k) | (r >= everything[todo])
+            # keep the k closest candidates of every finished query
+            sel = done[q]
+            q, pos, dist = q[sel], pos[sel], dist[sel]
+            order = np.lexsort((dist, q))
+            q, pos, dist = q[order], pos[order], dist[order]
+            rank = np.arange(len(q)) - np.searchsorted(q, q)
+            first_k = rank < k
+            rows = todo[q[first_k]]
+            indices[rows, rank[first_k]] = self._order[pos[first_k]]
+            distances[rows, rank[first_k]] = dist[first_k]
+            radius[todo[~done]] *= 2
+            todo = todo[~done]
+        return indices, distances
@@ -0,0 +1,147 @@
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+import numpy as np
+from .fruits import FruitLookupError
+
+# File layout (all integers little-endian uint64):
+#   magic (8 bytes) | count n | blob length | offsets[n + 1] | UTF-8 blob
+# Label i is blob[offsets[i]:offsets[i + 1]].
+MAGIC = b"FRUITVOC"
+_HEADER = struct.Struct("<8sQQ")
+
+
+def build_vocab(fruits: Iterable[str], path: Union[str, Path]) -> Path:
+    """Write ``fruits`` as a memory-mappable vocabulary file.
+
+    Ids follow ``sorted(fruits)``, the ordering used by ``id_to_fruit_fixed``.
+    The file is written next to ``path`` and renamed into place, so readers
+    never see a partial vocabulary.
+    """
+    path = Path(path)
+    encoded = [name.encode("utf-8") for name in sorted(fruits)]
+    lengths = np.fromiter(map(len, encoded), dtype="<u8", count=len(encoded))
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum(lengths, out=offsets[1:])
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(encoded), int(offsets[-1])))
+        f.write(offsets.tobytes())
+        f.writelines(encoded)
+    os.replace(tmp_path, path)
+    return path
+
+
+class MmapVocab:
+    """Read-only, zero-copy view of a vocabulary written by ``build_vocab``.
+
+    The file is mapped with ``mmap`` so pages are loaded lazily and shared
+    between every process that opens the same file. Instances pickle by path,
+    which lets worker processes reopen the mapping instead of copying it.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size:
+            raise ValueError(f"{self.path} is not a vocabulary file.")
+        magic, count, blob_len = _HEADER.unpack_from(self._mm)
+        start = _HEADER.size + 8 * (count + 1)
+        if magic != MAGIC or len(self._mm) != start + blob_len:
+            raise ValueError(f"{self.path} is not a vocabulary file.")
+        self._count = count
+        self._map_views()
+
+    def _map_views(self) -> None:
+        start = _HEADER.size + 8 * (self._count + 1)
+        self._offsets = np.frombuffer(
+            self._mm, dtype="<u8", count=self._count + 1, offset=_HEADER.size
+        )
+        if sys.byteorder == "little":
+            # native view: scalar indexing returns ints without numpy overhead
+            self._bounds = memoryview(self._mm)[_HEADER.size : start].cast("Q")
+        else:
+            self._bounds = self._offsets
+        self._blob = memoryview(self._mm)[start:]
+
+    def _span(self, fruit_id: int) -> memoryview:
+        if fruit_id < 0 or fruit_id >= self._count:
+            raise FruitLookupError(
+                f"Fruit id {fruit_id} is out of range for list length {self._count}."
+            )
+        return self._blob[self._bounds[fruit_id] : self._bounds[fruit_id + 1]]
+
+    def id_to_bytes(self, fruit_id: int) -> memoryview:
+        """UTF-8 bytes of a label as a zero-copy view into the mapping."""
+        return self._span(fruit_id)
+
+    def id_to_name(self, fruit_id: int) -> str:
+        return str(self._span(fruit_id), "utf-8")
+
+    def name_to_id(self, name: str) -> int:
+        # UTF-8 byte order matches code point order, so the sorted blob can
+        # be binary searched without decoding.
+        target = name.encode("utf-8")
+        bounds, blob = self._bounds, self._blob
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if blob[bounds[mid] : bounds[mid + 1]].tobytes() < target:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self._count and blob[bounds[low] : bounds[low + 1]] == target:
+            return low
+        raise KeyError(f"Fruit {name!r} is not in the catalog.")
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        try:
+            self.name_to_id(name)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, fruit_id: int) -> str:
+        return self.id_to_name(fruit_id)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for fruit_id in range(self._count):
+            yield self.id_to_name(fruit_id)
+
+    def __reduce__(self):
+        return (type(self), (str(self.path),))
+
+    def close(self) -> None:
+        """Unmap the file; fails while views from ``id_to_bytes`` are alive."""
+        if self._mm.closed:
+            return
+        # our own views export the mapping too and must go before it can close
+        self._blob.release()
+        if isinstance(self._bounds, memoryview):
+            self._bounds.release()
+        self._bounds = self._offsets = None
+        try:
+            self._mm.close()
+        except BufferError:
+            self._map_views()  # still open, so keep the instance usable
+            raise BufferError(
+                f"Cannot close {self.path}: views returned by id_to_bytes are still alive."
+            ) from None
+
+    def __enter__(self) -> "MmapVocab":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MmapVocab({str(self.path)!r}, {self._count} fruits)"
@@ -4,6 +4,7 @@ Quick verification script to check if setup is complete
 """
 
 import sys
+from importlib.util import find_spec
 
 def check_setup():
     """Verify that setup is complete"""
@@ -44,11 +45,12 @@ def check_setup():
         'torchvision': 'torchvision',
     }
     
+    # find_spec only locates the package; nothing is imported, so this
+    # check takes milliseconds even with torch installed
     for module_name, package_name in dependencies.items():
-        try:
-            __import__(module_name)
+        if find_spec(module_name) is not None:
             print("   ✓ {} installed".format(package_name))
-        except ImportError:
+        else:
             print("   ❌ {} NOT installed".format(package_name))
             if module_name in ['numpy', 'matplotlib']:
                 all_ok = False